@@ -1,5 +1,6 @@
 """Load and query ACP archetype data from JSON-LD files."""
 import json
+import math
 from pathlib import Path
 from typing import Dict, List, Optional
 import numpy as np
@@ -15,6 +16,9 @@ AXES = [
     "voluntary-fated",
 ]
 
+# Axis name -> position in AXES
+AXIS_TO_IDX = {axis: i for i, axis in enumerate(AXES)}
+
 
 class ACPLoader:
     def __init__(self, acp_path: str):
@@ -23,6 +27,7 @@ class ACPLoader:
         self.primordials: Dict[str, dict] = {}
         self.systems: Dict[str, dict] = {}
         self._alias_index: Dict[str, List[str]] = {}  # name -> list of archetype @ids
+        self._relationships_cache: Dict[Optional[str], List[Dict]] = {}  # type filter -> entries
         self._load_all()
 
     def _load_all(self):
@@ -187,7 +192,8 @@ class ACPLoader:
         c2 = self.get_coordinates(id2)
         if c1 is None or c2 is None:
             return None
-        return float(np.linalg.norm(c1 - c2))
+        diff = c1 - c2
+        return math.sqrt(diff @ diff)
 
     def get_nearby(self, archetype_id: str, threshold: float = 0.3) -> List[tuple]:
         """Find archetypes within distance threshold."""
@@ -201,17 +207,19 @@ class ACPLoader:
                 continue
             other = self.get_coordinates(other_id)
             if other is not None:
-                dist = float(np.linalg.norm(base - other))
+                diff = base - other
+                dist = math.sqrt(diff @ diff)
                 if dist <= threshold:
                     nearby.append((other_id, dist))
 
         return sorted(nearby, key=lambda x: x[1])
 
     def get_all_relationships(self, type_filter: Optional[str] = None) -> List[Dict]:
-        """Extract all relationships from all archetypes.
+        """Extract all relationships from all archetypes (cached per filter).
 
         Walks every archetype's 'relationships' array and collects entries
-        with the source archetype ID added.
+        with the source archetype ID added.  The walk is done once per
+        type filter; each call returns fresh copies of the entries.
 
         Args:
             type_filter: If set, only return relationships of this type
@@ -221,16 +229,20 @@ class ACPLoader:
             List of dicts, each with 'source', 'target', 'type', plus all
             type-specific properties (fidelity, axis, strength, etc.).
         """
-        results = []
-        for arch_id, arch in self.archetypes.items():
-            for rel in arch.get("relationships", []):
-                rel_type = rel.get("type", "")
-                if type_filter and rel_type != type_filter:
-                    continue
-                entry = {"source": arch_id}
-                entry.update(rel)
-                results.append(entry)
-        return results
+        key = type_filter or None
+        cached = self._relationships_cache.get(key)
+        if cached is None:
+            cached = []
+            for arch_id, arch in self.archetypes.items():
+                for rel in arch.get("relationships", []):
+                    rel_type = rel.get("type", "")
+                    if type_filter and rel_type != type_filter:
+                        continue
+                    entry = {"source": arch_id}
+                    entry.update(rel)
+                    cached.append(entry)
+            self._relationships_cache[key] = cached
+        return [dict(entry) for entry in cached]
 
     def get_primordial_ids(self) -> List[str]:
         """Return sorted list of all primordial IDs."""
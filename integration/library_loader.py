@@ -32,6 +32,7 @@ class LibraryLoader:
         self.conn = sqlite3.connect(str(self.db_path))
         self.conn.row_factory = sqlite3.Row
         self._cooccurrence_cache: Optional[Dict[Tuple[str, str], int]] = None
+        self._motif_entities_cache: Dict[str, List[str]] = {}
 
     def get_all_entities(self) -> List[Entity]:
         """Retrieve all entities."""
@@ -131,7 +132,11 @@ class LibraryLoader:
         ]
 
     def get_motif_entities(self, motif_code: str) -> List[str]:
-        """Get entity names that appear in segments tagged with a motif."""
+        """Get entity names that appear in segments tagged with a motif (cached)."""
+        cached = self._motif_entities_cache.get(motif_code)
+        if cached is not None:
+            return list(cached)
+
         rows = self.conn.execute("""
             SELECT DISTINCT e.canonical_name
             FROM motif_tags mt
@@ -141,7 +146,9 @@ class LibraryLoader:
               AND mt.confidence >= 0.3
         """, (motif_code,)).fetchall()
 
-        return [r["canonical_name"] for r in rows]
+        entities = [r["canonical_name"] for r in rows]
+        self._motif_entities_cache[motif_code] = entities
+        return list(entities)
 
     def get_all_motif_codes(self) -> List[str]:
         """Get all unique motif codes that have tags."""
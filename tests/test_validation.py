@@ -22,6 +22,18 @@ from validation.calibrate_coordinates import CoordinateCalibrator
 from validation.statistical_tests import StatisticalTests
 from validation.alternative_metrics import AlternativeMetrics
 from validation.data_quality import DataQualityAuditor
+from validation.v2_tests import (
+    condensed_index, pair_distances, spearman_from_ranks, weighted_distance,
+    weighted_distance_batch, weighted_pdist,
+)
+from validation.v2_tests.axis_interpretability import _rounded
+from validation.v2_tests.echo_coherence import EchoCoherenceTest
+from validation.v2_tests.human_audit import HumanAuditTest
+from validation.v2_tests.miroglyph_structure import _silhouette_score
+from validation.v2_tests.motif_bridging import _top_rounded
+from validation.v2_tests.relationship_geometry import _sorted_ends
+from validation.v2_tests.primordial_clustering import PrimordialClusteringTest, _wilson_bounds
+from validation.v2_tests.miroglyph_structure_v2 import _anova_columns, _kruskal_columns
 
 ACP_PATH = PROJECT_ROOT / "ACP"
 DB_PATH = PROJECT_ROOT / "data" / "mythic_patterns.db"
@@ -290,6 +302,173 @@ class TestCalibration:
                 assert 0 <= v <= 1, f"Coordinate {axis}={v} out of bounds for {arch_id}"
 
 
+# ── v2 Shared Utilities ──────────────────────────────────────
+
+class TestWeightedDistance:
+    def test_pdist_matches_pairwise(self):
+        """Condensed weighted_pdist should equal weighted_distance per pair."""
+        coords = np.random.default_rng(0).random((6, 8))
+        expected = [
+            weighted_distance(coords[i], coords[j])
+            for i in range(6) for j in range(i + 1, 6)
+        ]
+        np.testing.assert_allclose(weighted_pdist(coords), expected)
+
+    def test_batch_matches_pairwise(self):
+        rng = np.random.default_rng(1)
+        a, b = rng.random((5, 8)), rng.random((5, 8))
+        expected = [weighted_distance(a[k], b[k]) for k in range(5)]
+        np.testing.assert_allclose(weighted_distance_batch(a, b), expected)
+
+    def test_pair_distances_match_pairwise(self):
+        coords = np.random.default_rng(2).random((6, 8))
+        i, j = np.array([0, 2, 5]), np.array([1, 4, 3])
+        plain, weighted = pair_distances(coords, i, j)
+        np.testing.assert_allclose(plain, np.linalg.norm(coords[i] - coords[j], axis=1))
+        np.testing.assert_allclose(weighted, weighted_distance_batch(coords[i], coords[j]))
+
+    def test_condensed_index_matches_pdist_order(self):
+        i, j = np.triu_indices(7, k=1)
+        np.testing.assert_array_equal(condensed_index(7, i, j), np.arange(len(i)))
+        assert condensed_index(7, 2, 5) == 13
+
+    def test_pdist_preserves_float32(self):
+        coords = np.random.default_rng(0).random((4, 8)).astype(np.float32)
+        assert weighted_pdist(coords).dtype == np.float32
+
+
+class TestSilhouette:
+    def test_matches_per_point_definition(self):
+        """Vectorized silhouette should match the per-point definition, singletons included."""
+        coords = np.random.default_rng(3).random((9, 8))
+        labels = np.array([0, 0, 0, 1, 1, 1, 1, 2, 5])
+        dist = np.linalg.norm(coords[:, None] - coords[None, :], axis=2)
+        expected = []
+        for i in range(9):
+            own = labels == labels[i]
+            a = dist[i][own].sum() / (own.sum() - 1) if own.sum() > 1 else 0.0
+            b = min(dist[i][labels == l].mean() for l in set(labels) if l != labels[i])
+            expected.append((b - a) / max(a, b))
+        assert _silhouette_score(coords, labels) == pytest.approx(np.mean(expected))
+
+    def test_single_cluster_is_zero(self):
+        assert _silhouette_score(np.random.default_rng(0).random((5, 8)), np.zeros(5)) == 0.0
+
+
+class TestAxisInterpretabilityRounding:
+    def test_rounded_matches_builtin_round_on_half_units(self):
+        values = np.array([0.7325, 0.12345, -0.00005, np.nan])
+        assert _rounded(values[:3], 3) == [round(v, 3) for v in values[:3].tolist()]
+        assert _rounded(values[:3], 4) == [round(v, 4) for v in values[:3].tolist()]
+        assert np.isnan(_rounded(values, 4)[-1])
+
+
+class TestEchoCoherence:
+    def test_no_coordinates_reports_error(self, tmp_path):
+        """An ACP tree with no coordinates yields the error dict, not a crash."""
+        result = EchoCoherenceTest(ACPLoader(str(tmp_path))).run()
+        assert result == {"error": "Only 0 valid echo pairs found", "pass": False}
+
+
+class TestHumanAuditNeighbors:
+    def test_nearby_matches_get_nearby_on_boundary(self, tmp_path):
+        """Pairs exactly 0.5 apart on a 0.05 grid are kept, as get_nearby keeps them."""
+        acp = ACPLoader(str(tmp_path))
+        grid = np.round(np.arange(0.0, 1.0001, 0.05), 2)
+        for k, v in enumerate(grid.tolist()):
+            coords = dict.fromkeys(AXES, 0.5)
+            coords[AXES[0]] = v
+            acp.archetypes[f"a{k}"] = {"name": f"A{k}", "spectralCoordinates": coords}
+        audit = HumanAuditTest(acp)
+        audit._build_coordinate_index()
+        rows = list(range(len(grid)))
+        for row, nearby in zip(rows, audit._nearby_rows(rows, 0.5)):
+            assert nearby == acp.get_nearby(f"a{row}", threshold=0.5)
+
+
+class TestMotifBridgingReview:
+    def test_top_rounded_matches_stable_sort(self):
+        """Near-ties that round together keep index order, as with sorted()."""
+        values = np.array([0.12344, 0.5, 0.12341, 0.7, 0.12336, 0.1, 0.12349, 0.2])
+        keys = [round(v, 4) for v in values.tolist()]
+        for largest in (True, False):
+            expected = sorted(range(len(values)), key=lambda i: keys[i], reverse=largest)[:3]
+            assert _top_rounded(values, 3, largest=largest) == expected
+
+
+class TestRelationshipGeometryReview:
+    def test_sorted_ends_matches_stable_sort(self):
+        """Ties at either cut keep the positions a stable full sort gives."""
+        values = np.array([0.3, 0.1, 0.3, 0.9, 0.1, 0.3, 0.9, 0.5, 0.9, 0.1, 0.3])
+        order = sorted(range(len(values)), key=lambda i: values[i])
+        for k in (1, 2, 3, 4):
+            assert _sorted_ends(values, k) == (order[:k], order[-k:])
+        assert _sorted_ends(values[:3], 5) == ([1, 0, 2], [1, 0, 2])
+
+
+class TestPrimordialVectors:
+    def test_repeated_primordial_keeps_last_weight(self, tmp_path):
+        acp = ACPLoader(str(tmp_path))
+        acp.primordials = {"p:a": {}, "p:b": {}}
+        acp.archetypes = {
+            "x": {"instantiates": [
+                {"primordial": "p:a", "weight": 0.9},
+                {"primordial": "p:b", "weight": 0.2},
+                {"primordial": "p:a", "weight": 0.4},
+            ]},
+            "y": {"instantiates": [{"primordial": "p:missing", "weight": 1.0}]},
+        }
+        vectors, primordial_ids = PrimordialClusteringTest(acp)._build_primordial_vectors()
+        assert primordial_ids == ["p:a", "p:b"]
+        assert list(vectors) == ["x"]
+        assert vectors["x"].tolist() == [0.4, 0.2]
+
+
+class TestPrimordialEarlyStop:
+    def test_wilson_bounds_match_scipy(self):
+        from scipy.stats import binomtest, norm
+        for hits, n in [(0, 100), (3, 200), (40, 100)]:
+            ci = binomtest(hits, n).proportion_ci(2 * norm.cdf(3.0) - 1, method="wilson")
+            low, high = _wilson_bounds(hits, n, 3.0)
+            assert low == pytest.approx(max(ci.low, 0.0), abs=1e-6)
+            assert high == pytest.approx(ci.high, abs=1e-6)
+
+
+class TestConditionProgressionStats:
+    def test_spearman_matches_scipy(self):
+        from scipy.stats import rankdata, spearmanr
+        rng = np.random.default_rng(4)
+        bins = rng.integers(1, 7, 60)
+        vals = np.round(rng.random(60), 2)
+        r, p = spearman_from_ranks(rankdata(bins), vals)
+        expected = spearmanr(bins, vals)
+        assert r == pytest.approx(expected[0])
+        assert p == pytest.approx(expected[1])
+
+    def test_anova_matches_f_oneway(self):
+        from scipy.stats import f_oneway
+        rng = np.random.default_rng(5)
+        x = rng.random((40, 8))
+        bins = rng.integers(2, 6, 40)
+        f_stats, p_vals = _anova_columns(x, bins)
+        for ax in range(8):
+            expected = f_oneway(*[x[bins == b, ax] for b in np.unique(bins)])
+            assert f_stats[ax] == pytest.approx(expected[0])
+            assert p_vals[ax] == pytest.approx(expected[1])
+
+    def test_kruskal_matches_scipy(self):
+        from scipy.stats import kruskal
+        rng = np.random.default_rng(9)
+        # Rounded values so the tie correction is exercised
+        x = np.round(rng.random((45, 8)), 1)
+        arcs = rng.integers(0, 3, 45)
+        h_stats, p_vals = _kruskal_columns(x, arcs)
+        for ax in range(8):
+            expected = kruskal(*[x[arcs == a, ax] for a in range(3)])
+            assert h_stats[ax] == pytest.approx(expected[0])
+            assert p_vals[ax] == pytest.approx(expected[1])
+
+
 # ── Report Generation Tests ──────────────────────────────────
 
 class TestReportGeneration:
@@ -2,10 +2,18 @@
 
 Shared utilities and constants used across all v2 test modules.
 """
+import hashlib
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
 import numpy as np
+from scipy.stats import rankdata, t as t_dist
 
 from integration.acp_loader import AXES
 
+# On-disk cache for library-derived indexes, keyed by a fingerprint of the DB
+CACHE_DIR = Path(__file__).parent.parent.parent / ".cache"
+
 
 # ==============================================================================
 # Empirical Axis Weights
@@ -27,13 +35,19 @@ EMPIRICAL_AXIS_WEIGHTS = {
     "ascent-descent": 0.20,
 }
 
-# Pre-computed weight vector in AXES order for fast numpy operations
-WEIGHT_VECTOR = np.array([EMPIRICAL_AXIS_WEIGHTS[a] for a in AXES])
+# Pre-computed weight vector in AXES order for fast numpy operations.
+# Stored as float32 so weighted math stays in float32 when coordinates are
+# float32 (float64 coordinates still promote as usual).
+WEIGHT_VECTOR = np.array([EMPIRICAL_AXIS_WEIGHTS[a] for a in AXES], dtype=np.float32)
 
 # Normalized so that unweighted distance is preserved in scale
 # (sum of squared weights = n_axes for scale parity)
-_norm_factor = np.sqrt(len(AXES) / np.sum(WEIGHT_VECTOR ** 2))
-WEIGHT_VECTOR_NORMALIZED = WEIGHT_VECTOR * _norm_factor
+_norm_factor = np.sqrt(len(AXES) / np.sum(WEIGHT_VECTOR.astype(np.float64) ** 2))
+WEIGHT_VECTOR_NORMALIZED = (WEIGHT_VECTOR * _norm_factor).astype(np.float32)
+
+# Squared weights, the form actually used in distance computations
+WEIGHT_SQ = WEIGHT_VECTOR ** 2
+WEIGHT_SQ_NORMALIZED = WEIGHT_VECTOR_NORMALIZED ** 2
 
 
 def weighted_distance(c1: np.ndarray, c2: np.ndarray, normalized: bool = True) -> float:
@@ -48,9 +62,63 @@ def weighted_distance(c1: np.ndarray, c2: np.ndarray, normalized: bool = True) -
     Returns:
         Weighted Euclidean distance as a float.
     """
-    w = WEIGHT_VECTOR_NORMALIZED if normalized else WEIGHT_VECTOR
+    w_sq = WEIGHT_SQ_NORMALIZED if normalized else WEIGHT_SQ
     diff = c1 - c2
-    return float(np.sqrt(np.sum(w ** 2 * diff ** 2)))
+    # sum(w_i^2 * d_i^2) as a single dot product, reduced to a Python float
+    return ((w_sq * diff) @ diff).item() ** 0.5
+
+
+def weighted_distance_batch(a: np.ndarray, b: np.ndarray, normalized: bool = True) -> np.ndarray:
+    """Compute row-wise weighted Euclidean distances between two matrices.
+
+    Args:
+        a: (N, 8) array of coordinate vectors.
+        b: (N, 8) array of coordinate vectors, paired row-by-row with a.
+        normalized: If True, use scale-normalized weights.
+
+    Returns:
+        (N,) array where entry k is weighted_distance(a[k], b[k]).
+    """
+    w_sq = WEIGHT_SQ_NORMALIZED if normalized else WEIGHT_SQ
+    diff = a - b
+    return np.sqrt((diff * diff) @ w_sq)
+
+
+def pair_sq_diffs(coords: np.ndarray, i: np.ndarray, j: np.ndarray) -> np.ndarray:
+    """Squared per-axis differences for indexed row pairs.
+
+    Any plain, weighted or axis-subset distance over the pairs is a row
+    reduction of this one buffer.
+
+    Args:
+        coords: (N, 8) array of coordinate vectors.
+        i, j: (M,) integer arrays; pair k is (coords[i[k]], coords[j[k]]).
+
+    Returns:
+        (M, 8) array of (coords[i] - coords[j]) ** 2.
+    """
+    diff = coords[i] - coords[j]
+    diff *= diff
+    return diff
+
+
+def pair_distances(coords: np.ndarray, i: np.ndarray, j: np.ndarray,
+                   normalized: bool = True):
+    """Compute plain and weighted Euclidean distances for indexed row pairs.
+
+    Both norms are taken from one buffer of squared per-axis differences.
+
+    Args:
+        coords: (N, 8) array of coordinate vectors.
+        i, j: (M,) integer arrays; pair k is (coords[i[k]], coords[j[k]]).
+        normalized: If True, use scale-normalized weights.
+
+    Returns:
+        (plain, weighted) pair of (M,) distance arrays.
+    """
+    w_sq = WEIGHT_SQ_NORMALIZED if normalized else WEIGHT_SQ
+    sq_diffs = pair_sq_diffs(coords, i, j)
+    return np.sqrt(sq_diffs.sum(axis=1)), np.sqrt(sq_diffs @ w_sq)
 
 
 def weighted_pdist(coords: np.ndarray, normalized: bool = True) -> np.ndarray:
@@ -63,12 +131,104 @@ def weighted_pdist(coords: np.ndarray, normalized: bool = True) -> np.ndarray:
     Returns:
         Condensed distance matrix (like scipy.spatial.distance.pdist).
     """
-    w = WEIGHT_VECTOR_NORMALIZED if normalized else WEIGHT_VECTOR
+    w_sq = WEIGHT_SQ_NORMALIZED if normalized else WEIGHT_SQ
     n = coords.shape[0]
-    dists = []
-    for i in range(n):
-        for j in range(i + 1, n):
-            diff = coords[i] - coords[j]
-            d = float(np.sqrt(np.sum(w ** 2 * diff ** 2)))
-            dists.append(d)
-    return np.array(dists)
+    out = np.empty(n * (n - 1) // 2, dtype=np.result_type(coords, w_sq))
+    # Row i contributes the condensed block of pairs (i, i+1..n-1)
+    start = 0
+    for i in range(n - 1):
+        diff = coords[i + 1:] - coords[i]
+        end = start + n - 1 - i
+        np.sqrt((diff * diff) @ w_sq, out=out[start:end])
+        start = end
+    return out
+
+
+def condensed_index(n: int, i, j):
+    """Position of pair (i, j), i < j, in a condensed pdist vector over n points.
+
+    Works elementwise on integer arrays as well as on scalars.
+    """
+    return n * i - i * (i + 1) // 2 + (j - i - 1)
+
+
+def spearman_from_ranks(x_ranks: np.ndarray, y: np.ndarray) -> Tuple[float, float]:
+    """Spearman r and two-sided p for y against an already-ranked x.
+
+    Same statistic and t-distribution p-value as scipy.stats.spearmanr, but
+    lets callers rank a shared x once and correlate it with several y.
+
+    Args:
+        x_ranks: (N,) average ranks of x (scipy.stats.rankdata).
+        y: (N,) raw values; ranked here.
+
+    Returns:
+        (r, p) as Python floats.
+    """
+    r = np.clip(np.corrcoef(x_ranks, rankdata(y))[0, 1], -1.0, 1.0)
+    dof = len(x_ranks) - 2
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t_stat = r * np.sqrt(dof / ((1.0 - r) * (1.0 + r)))
+    return float(r), float(2 * t_dist.sf(abs(t_stat), dof))
+
+
+def library_fingerprint(library) -> str:
+    """Short content key for the library DB (path, size, modification time)."""
+    db_path = Path(library.db_path).resolve()
+    st = db_path.stat()
+    key = f"{db_path}|{st.st_size}|{st.st_mtime_ns}"
+    return hashlib.blake2b(key.encode("utf-8"), digest_size=8).hexdigest()
+
+
+def load_motif_index(library, cache_dir: Optional[Path] = None) -> Dict[str, List[str]]:
+    """Load the motif code -> entity names index.
+
+    Building it costs one SQL query per motif code, so the result is
+    persisted to an .npz file keyed by the library fingerprint and reused
+    until the database changes.  Shared by every test that needs it.
+
+    Args:
+        library: LibraryLoader to index.
+        cache_dir: Directory for the cache file (defaults to CACHE_DIR).
+
+    Returns:
+        Dict of motif code -> entity names, in get_all_motif_codes order.
+    """
+    cache_dir = Path(cache_dir) if cache_dir else CACHE_DIR
+    cache_path = cache_dir / f"motif_index_{library_fingerprint(library)}.npz"
+    if cache_path.exists():
+        try:
+            with np.load(cache_path) as data:
+                codes = data["codes"].tolist()
+                offsets = data["offsets"].tolist()
+                entities = data["entities"].tolist()
+            return {
+                code: entities[offsets[i]:offsets[i + 1]]
+                for i, code in enumerate(codes)
+            }
+        except (OSError, KeyError, ValueError):
+            pass  # Unreadable cache — rebuild below
+
+    index = {
+        code: library.get_motif_entities(code)
+        for code in library.get_all_motif_codes()
+    }
+
+    # Flatten to codes / offsets / entities so no pickling is needed
+    codes = list(index)
+    offsets = [0]
+    flat = []
+    for code in codes:
+        flat.extend(index[code])
+        offsets.append(len(flat))
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        np.savez(
+            cache_path,
+            codes=np.array(codes, dtype=str),
+            offsets=np.array(offsets, dtype=np.int64),
+            entities=np.array(flat, dtype=str),
+        )
+    except OSError:
+        pass  # Cache is an optimization only
+    return index
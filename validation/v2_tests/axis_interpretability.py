@@ -11,13 +11,18 @@ to the global mean. Entity-type partitions are non-overlapping and provide
 the primary signal.
 """
 import numpy as np
-from scipy.stats import ttest_1samp, mannwhitneyu
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from scipy.stats import ttest_1samp, ttest_ind, mannwhitneyu
 from typing import Dict, List, Optional
 from collections import defaultdict
 
-from integration.acp_loader import ACPLoader, AXES
+from integration.acp_loader import ACPLoader, AXES, AXIS_TO_IDX
 from integration.library_loader import LibraryLoader
 from integration.entity_mapper import EntityMapper
+from validation.v2_tests import CACHE_DIR, load_motif_index
+
+_AXES_SET = frozenset(AXES)
 
 
 # ==============================================================================
@@ -204,100 +209,220 @@ CONTRASTIVE_TYPE_TESTS = [
 ]
 
 
+def _resolve_axes(mappings, low_token: str):
+    """Return (axis_idx, expects_low) for each mapping in a table.
+
+    Every table keeps its axis name and direction as the third- and
+    second-to-last fields; expects_low is True when direction == low_token.
+    """
+    return [(AXIS_TO_IDX[m[-3]], m[-2] == low_token) for m in mappings]
+
+
+def _rounded(values: np.ndarray, ndigits: int) -> List[float]:
+    """Builtin round() over a numeric column.
+
+    np.round scales, rounds and rescales, so it can disagree with round()
+    on values that sit on a half-unit; reported digits go through round().
+    """
+    return [round(v, ndigits) for v in values.tolist()]
+
+
+# Axis indices and direction flags, resolved once at import
+_FINE_GRAINED_AXES = _resolve_axes(FINE_GRAINED_MOTIF_MAPPINGS, "low")
+_ENTITY_TYPE_AXES = _resolve_axes(ENTITY_TYPE_AXIS_MAPPINGS, "low")
+_CONTRASTIVE_AXES = _resolve_axes(CONTRASTIVE_TYPE_TESTS, "a<b")
+
+
+def _mannwhitneyu_columns(a: np.ndarray, b: np.ndarray, alternative: str):
+    """Column-wise Mann-Whitney U between two (n x k) samples in batched calls.
+
+    SciPy's method="auto" picks exact vs asymptotic once for the whole batch,
+    so the per-column choice (exact when either group has <=8 values and the
+    column has no ties) is applied here explicitly.
+    """
+    u_stat, u_p = mannwhitneyu(a, b, alternative=alternative, axis=0, method="asymptotic")
+    if a.shape[0] <= 8 or b.shape[0] <= 8:
+        both = np.sort(np.concatenate([a, b]), axis=0)
+        no_ties = ~np.any(both[1:] == both[:-1], axis=0)
+        if no_ties.any():
+            _, exact_p = mannwhitneyu(
+                a[:, no_ties], b[:, no_ties],
+                alternative=alternative, axis=0, method="exact",
+            )
+            u_p[no_ties] = exact_p
+    return u_stat, u_p
+
+
 class AxisInterpretabilityTest:
-    def __init__(self, acp: ACPLoader, library: LibraryLoader, mapper: EntityMapper):
+    def __init__(self, acp: ACPLoader, library: LibraryLoader, mapper: EntityMapper,
+                 cache_dir: Optional[str] = None):
         self.acp = acp
         self.library = library
         self.mapper = mapper
+        self.cache_dir = Path(cache_dir) if cache_dir else CACHE_DIR
+        self._motif_index = load_motif_index(self.library, self.cache_dir)
+        self._build_motif_lookup()
+
+        # Library entity names by type, shared by both entity-type suites
+        self._entities_by_type = defaultdict(list)
+        for e in self.library.get_all_entities():
+            self._entities_by_type[getattr(e, 'entity_type', '')].append(e.canonical_name)
+
+    def _build_motif_lookup(self):
+        """Invert the motif index into exact-code and prefix -> entity sets.
+
+        Every code contributes to the bucket of each of its prefixes
+        (A1010 -> A, A1, A10, A101, A1010), so both helpers below are a
+        single dict lookup.
+        """
+        exact = defaultdict(set)
+        prefix = defaultdict(set)
+        for code, code_entities in self._motif_index.items():
+            code_upper = code.upper()
+            exact[code_upper].update(code_entities)
+            for k in range(1, len(code_upper) + 1):
+                prefix[code_upper[:k]].update(code_entities)
+        self._exact_to_entities = dict(exact)
+        self._prefix_to_entities = dict(prefix)
 
     def _get_entities_for_motif_prefix(self, prefix: str) -> List[str]:
         """Get all library entity names tagged with motifs starting with prefix."""
-        entities = set()
-        for code in self.library.get_all_motif_codes():
-            if code.upper().startswith(prefix.upper()):
-                for e in self.library.get_motif_entities(code):
-                    entities.add(e)
-        return list(entities)
+        return list(self._prefix_to_entities.get(prefix.upper(), ()))
 
     def _get_entities_for_exact_code(self, motif_code: str) -> List[str]:
         """Get all library entity names tagged with an exact motif code (or codes starting with it)."""
-        entities = set()
-        code_upper = motif_code.upper()
-        for code in self.library.get_all_motif_codes():
-            # Match exact code or immediate sub-codes (e.g., A1 matches A1, A10 matches A10)
-            if code.upper() == code_upper:
-                for e in self.library.get_motif_entities(code):
-                    entities.add(e)
-        return list(entities)
+        return list(self._exact_to_entities.get(motif_code.upper(), ()))
+
+    def _build_coordinate_index(self):
+        """Build a structure-of-arrays view of entity coordinates.
+
+        Sets self._entity_names (row -> name), self._entity_idx (name -> row),
+        self._coord_matrix (n_entities x n_axes, NaN rows for entities without
+        coordinates), self._valid_mask and self._type_rows (entity type ->
+        rows with coordinates). Rows cover every library entity
+        plus any mapped name not in the library. Like mapper.get_mapping,
+        only the first mapping for an entity is considered.
+        """
+        mappings = self.mapper.mappings
+        first_mapping = {}
+        for m in mappings:
+            first_mapping.setdefault(m.library_entity, m)
+
+        # Archetype coordinates, fetched once per distinct mapped archetype;
+        # self._mapper_rows holds one row per mapping (duplicates included)
+        archetype_ids = list(dict.fromkeys(m.acp_archetype_id for m in mappings))
+        archetype_row = {aid: row for row, aid in enumerate(archetype_ids)}
+        acp_coord_mat = np.full((len(archetype_ids), len(AXES)), np.nan)
+        for row, aid in enumerate(archetype_ids):
+            c = self.acp.get_coordinates(aid)
+            if c is not None:
+                acp_coord_mat[row] = c
+        self._acp_coord_mat = acp_coord_mat
+        self._mapper_rows = np.fromiter(
+            (archetype_row[m.acp_archetype_id] for m in mappings),
+            dtype=np.int64, count=len(mappings),
+        )
+
+        names = list(dict.fromkeys(
+            [e.canonical_name for e in self.library.get_all_entities()]
+            + list(first_mapping)
+        ))
+        # float32 storage; statistics upcast to float64 where data enters SciPy
+        coord_matrix = np.full((len(names), len(AXES)), np.nan, dtype=np.float32)
+        for row, name in enumerate(names):
+            m = first_mapping.get(name)
+            if m is not None:
+                coord_matrix[row] = acp_coord_mat[archetype_row[m.acp_archetype_id]]
+
+        self._entity_names = np.array(names, dtype=object)
+        self._entity_idx = {name: row for row, name in enumerate(names)}
+        self._coord_matrix = coord_matrix
+        self._valid_mask = ~np.isnan(coord_matrix[:, 0])
+        self._type_rows = {
+            t: self._entity_rows(ents) for t, ents in self._entities_by_type.items()
+        }
+
+    def _entity_rows(self, entities: List[str]) -> np.ndarray:
+        """Coordinate-matrix rows for the entities that have coordinates."""
+        idx, valid = self._entity_idx, self._valid_mask
+        return np.fromiter(
+            (idx[e] for e in entities if e in idx and valid[idx[e]]),
+            dtype=np.int64,
+        )
 
     def _entity_to_coordinate(self, entity_name: str) -> Optional[np.ndarray]:
         """Map a library entity to ACP coordinates via the entity mapper."""
-        mapping = self.mapper.get_mapping(entity_name)
-        if mapping is None:
+        row = self._entity_idx.get(entity_name)
+        if row is None or not self._valid_mask[row]:
             return None
-        return self.acp.get_coordinates(mapping.acp_archetype_id)
+        return self._coord_matrix[row]
 
     def _get_entities_by_type(self, entity_type: str) -> List[str]:
         """Get all library entity names of a given type."""
-        entities = []
-        for e in self.library.get_all_entities():
-            if getattr(e, 'entity_type', '') == entity_type:
-                entities.append(e.canonical_name)
-        return entities
+        return self._entities_by_type.get(entity_type, [])
 
     def _run_mapping_set(self, mappings, global_mean, use_exact_code=False):
         """Run a set of motif-axis mappings and return test results + pass info."""
+        # Get entities for each motif
+        if use_exact_code:
+            entity_sets = [self._get_entities_for_exact_code(m[0]) for m in mappings]
+        else:
+            entity_sets = [self._get_entities_for_motif_prefix(m[0]) for m in mappings]
+        row_sets = [self._entity_rows(ents) for ents in entity_sets]
+        if mappings is FINE_GRAINED_MOTIF_MAPPINGS:
+            resolved = _FINE_GRAINED_AXES
+        else:
+            resolved = _resolve_axes(mappings, "low")
+
+        # One-sample t-tests (group mean vs global mean) for every testable
+        # mapping in a single batched call: one NaN-padded row per mapping
+        testable = [k for k, rows in enumerate(row_sets) if rows.size >= 3]
+        columns = {}
+        if testable:
+            axis_idxs = [resolved[k][0] for k in testable]
+            width = max(row_sets[k].size for k in testable)
+            values = np.full((len(testable), width), np.nan)
+            for r, (k, axis_idx) in enumerate(zip(testable, axis_idxs)):
+                values[r, :row_sets[k].size] = self._coord_matrix[row_sets[k], axis_idx]
+            popmean = np.array([global_mean[axis_idx] for axis_idx in axis_idxs])
+            t_stats, t_ps = ttest_1samp(values, popmean[:, None], axis=1, nan_policy="omit")
+
+            group_means = np.nanmean(values, axis=1)
+            expects_low = np.array([resolved[k][1] for k in testable])
+            correct = np.where(expects_low, group_means < popmean, group_means > popmean)
+            # Pass = significant AND correct direction
+            passed = (t_ps < 0.05) & correct
+
+            # Round each numeric column up front; rows are materialized below
+            columns = dict(zip(testable, zip(
+                _rounded(group_means, 4),
+                _rounded(popmean, 4),
+                _rounded(group_means - popmean, 4),
+                correct.tolist(),
+                _rounded(t_stats, 4),
+                _rounded(t_ps, 6),
+                passed.tolist(),
+            )))
+
         test_results = []
         axes_with_pass = defaultdict(list)
-
-        for code_or_prefix, axis_name, direction, description in mappings:
-            axis_idx = AXES.index(axis_name)
-
-            # Get entities for this motif
-            if use_exact_code:
-                entities = self._get_entities_for_exact_code(code_or_prefix)
-            else:
-                entities = self._get_entities_for_motif_prefix(code_or_prefix)
-
-            # Map to coordinates
-            coords = []
-            mapped_names = []
-            for e in entities:
-                c = self._entity_to_coordinate(e)
-                if c is not None:
-                    coords.append(c)
-                    mapped_names.append(e)
-
-            if len(coords) < 3:
+        for k, ((code_or_prefix, axis_name, direction, description), entities, rows) in enumerate(
+            zip(mappings, entity_sets, row_sets)
+        ):
+            if k not in columns:
                 test_results.append({
                     "motif_code": code_or_prefix,
                     "axis": axis_name,
                     "direction": direction,
                     "description": description,
                     "n_entities": len(entities),
-                    "n_mapped": len(coords),
+                    "n_mapped": int(rows.size),
                     "result": "SKIPPED (insufficient data)",
                     "pass": False,
                 })
                 continue
 
-            # Extract values on the target axis
-            axis_values = np.array([c[axis_idx] for c in coords])
-            group_mean = float(axis_values.mean())
-            global_axis_mean = float(global_mean[axis_idx])
-
-            # One-sample t-test: does group mean differ from global mean?
-            t_stat, t_p = ttest_1samp(axis_values, global_axis_mean)
-
-            # Check direction
-            if direction == "low":
-                correct_direction = group_mean < global_axis_mean
-            else:
-                correct_direction = group_mean > global_axis_mean
-
-            # Pass = significant AND correct direction
-            passed = t_p < 0.05 and correct_direction
-
+            group_mean, global_axis_mean, delta, correct_direction, t_stat, t_p, passed = columns[k]
             if passed:
                 axes_with_pass[axis_name].append(code_or_prefix)
 
@@ -307,16 +432,16 @@ class AxisInterpretabilityTest:
                 "direction": direction,
                 "description": description,
                 "n_entities": len(entities),
-                "n_mapped": len(coords),
-                "group_mean": round(group_mean, 4),
-                "global_mean": round(global_axis_mean, 4),
-                "delta": round(group_mean - global_axis_mean, 4),
+                "n_mapped": int(rows.size),
+                "group_mean": group_mean,
+                "global_mean": global_axis_mean,
+                "delta": delta,
                 "correct_direction": correct_direction,
-                "t_statistic": round(float(t_stat), 4),
-                "p_value": round(float(t_p), 6),
+                "t_statistic": t_stat,
+                "p_value": t_p,
                 "pass": passed,
                 "result": "PASS" if passed else "FAIL",
-                "sample_entities": mapped_names[:5],
+                "sample_entities": self._entity_names[rows[:5]].tolist(),
             })
 
         return test_results, axes_with_pass
@@ -328,60 +453,75 @@ class AxisInterpretabilityTest:
         Stronger signal than one-sample tests because the comparison
         is between clearly distinct semantic categories.
         """
-        # Build coordinate arrays by entity type
-        type_coords = defaultdict(list)
-        type_names = defaultdict(list)
-
-        for e in self.library.get_all_entities():
-            c = self._entity_to_coordinate(e.canonical_name)
-            if c is not None:
-                type_coords[e.entity_type].append(c)
-                type_names[e.entity_type].append(e.canonical_name)
+        # Contiguous (n_t x n_axes) block per type, reused by every axis test
+        type_matrix = {
+            t: self._coord_matrix[rows].astype(np.float64)
+            for t, rows in self._type_rows.items()
+        }
+        empty = np.empty((0, len(AXES)))
+
+        # Both tests run once per type pair across all axes (axis=0)
+        pair_stats = {}
+        for type_a, type_b, _, _, _ in CONTRASTIVE_TYPE_TESTS:
+            mat_a = type_matrix.get(type_a, empty)
+            mat_b = type_matrix.get(type_b, empty)
+            if (type_a, type_b) in pair_stats or len(mat_a) < 3 or len(mat_b) < 3:
+                continue
+            t_stats, t_ps = ttest_ind(mat_a, mat_b, axis=0)
+            _, u_ps = _mannwhitneyu_columns(mat_a, mat_b, alternative="two-sided")
+            pair_stats[(type_a, type_b)] = (t_stats, t_ps, u_ps)
+
+        tested = [k for k, test in enumerate(CONTRASTIVE_TYPE_TESTS) if test[:2] in pair_stats]
+        columns = {}
+        if tested:
+            type_means = {t: mat.mean(axis=0) for t, mat in type_matrix.items()}
+            axis_idxs = [_CONTRASTIVE_AXES[k][0] for k in tested]
+            pairs = [CONTRASTIVE_TYPE_TESTS[k][:2] for k in tested]
+            mean_a = np.array([type_means[a][i] for (a, _), i in zip(pairs, axis_idxs)])
+            mean_b = np.array([type_means[b][i] for (_, b), i in zip(pairs, axis_idxs)])
+            # Two-sample t-test, plus Mann-Whitney U for non-parametric confirmation
+            t_stat, t_p, u_p = (
+                np.array([pair_stats[p][s][i] for p, i in zip(pairs, axis_idxs)])
+                for s in range(3)
+            )
+
+            a_lower = np.array([_CONTRASTIVE_AXES[k][1] for k in tested])
+            correct = np.where(a_lower, mean_a < mean_b, mean_a > mean_b)
+            # Pass if either test is significant AND direction is correct
+            passed = ((t_p < 0.10) | (u_p < 0.10)) & correct
+
+            columns = dict(zip(tested, zip(
+                _rounded(mean_a, 4),
+                _rounded(mean_b, 4),
+                _rounded(mean_a - mean_b, 4),
+                correct.tolist(),
+                _rounded(t_stat, 4),
+                _rounded(t_p, 6),
+                _rounded(u_p, 6),
+                passed.tolist(),
+            )))
 
         test_results = []
         axes_with_pass = defaultdict(list)
+        for k, (type_a, type_b, axis_name, direction, description) in enumerate(CONTRASTIVE_TYPE_TESTS):
+            n_a = len(type_matrix.get(type_a, empty))
+            n_b = len(type_matrix.get(type_b, empty))
 
-        for type_a, type_b, axis_name, direction, description in CONTRASTIVE_TYPE_TESTS:
-            axis_idx = AXES.index(axis_name)
-
-            coords_a = type_coords.get(type_a, [])
-            coords_b = type_coords.get(type_b, [])
-
-            if len(coords_a) < 3 or len(coords_b) < 3:
+            if k not in columns:
                 test_results.append({
                     "type_a": type_a,
                     "type_b": type_b,
                     "axis": axis_name,
                     "direction": direction,
                     "description": description,
-                    "n_a": len(coords_a),
-                    "n_b": len(coords_b),
+                    "n_a": n_a,
+                    "n_b": n_b,
                     "result": "SKIPPED (insufficient data)",
                     "pass": False,
                 })
                 continue
 
-            vals_a = np.array([c[axis_idx] for c in coords_a])
-            vals_b = np.array([c[axis_idx] for c in coords_b])
-            mean_a = float(vals_a.mean())
-            mean_b = float(vals_b.mean())
-
-            # Two-sample t-test
-            from scipy.stats import ttest_ind
-            t_stat, t_p = ttest_ind(vals_a, vals_b)
-
-            # Mann-Whitney U for non-parametric confirmation
-            u_stat, u_p = mannwhitneyu(vals_a, vals_b, alternative="two-sided")
-
-            # Check direction
-            if direction == "a<b":
-                correct_direction = mean_a < mean_b
-            else:
-                correct_direction = mean_a > mean_b
-
-            # Pass if either test is significant AND direction is correct
-            passed = (t_p < 0.10 or u_p < 0.10) and correct_direction
-
+            mean_a, mean_b, delta, correct_direction, t_stat, t_p, u_p, passed = columns[k]
             if passed:
                 axes_with_pass[axis_name].append(f"{type_a}vs{type_b}")
 
@@ -391,15 +531,15 @@ class AxisInterpretabilityTest:
                 "axis": axis_name,
                 "direction": direction,
                 "description": description,
-                "n_a": len(coords_a),
-                "n_b": len(coords_b),
-                "mean_a": round(mean_a, 4),
-                "mean_b": round(mean_b, 4),
-                "delta": round(mean_a - mean_b, 4),
+                "n_a": n_a,
+                "n_b": n_b,
+                "mean_a": mean_a,
+                "mean_b": mean_b,
+                "delta": delta,
                 "correct_direction": correct_direction,
-                "t_statistic": round(float(t_stat), 4),
-                "t_p_value": round(float(t_p), 6),
-                "mw_p_value": round(float(u_p), 6),
+                "t_statistic": t_stat,
+                "t_p_value": t_p,
+                "mw_p_value": u_p,
                 "pass": passed,
                 "result": "PASS" if passed else "FAIL",
             })
@@ -412,52 +552,71 @@ class AxisInterpretabilityTest:
         Entity types are non-overlapping partitions with clear semantic
         expectations for axis positioning.
         """
+        global_mean_arr = np.asarray(global_mean)
+        no_rows = np.empty(0, dtype=np.int64)
+        type_rows = [
+            self._type_rows.get(entity_type, no_rows)
+            for entity_type, _, _, _ in ENTITY_TYPE_AXIS_MAPPINGS
+        ]
+
+        # One-sample t-tests per type on every axis at once
+        type_stats = {}
+        for (entity_type, _, _, _), rows in zip(ENTITY_TYPE_AXIS_MAPPINGS, type_rows):
+            if entity_type not in type_stats and rows.size >= 3:
+                type_coords = self._coord_matrix[rows].astype(np.float64)
+                type_stats[entity_type] = (
+                    type_coords.mean(axis=0),
+                    *ttest_1samp(type_coords, global_mean_arr, axis=0),
+                )
+
+        tested = [k for k, rows in enumerate(type_rows) if rows.size >= 3]
+        columns = {}
+        if tested:
+            axis_idxs = np.array([_ENTITY_TYPE_AXES[k][0] for k in tested])
+            types = [ENTITY_TYPE_AXIS_MAPPINGS[k][0] for k in tested]
+            group_mean, t_stat, t_p = (
+                np.array([type_stats[t][s][i] for t, i in zip(types, axis_idxs)])
+                for s in range(3)
+            )
+            global_axis_mean = global_mean_arr[axis_idxs]
+
+            expects_low = np.array([_ENTITY_TYPE_AXES[k][1] for k in tested])
+            correct = np.where(
+                expects_low, group_mean < global_axis_mean, group_mean > global_axis_mean
+            )
+            passed = (t_p < 0.10) & correct  # Relaxed to p<0.10 for small groups
+
+            columns = dict(zip(tested, zip(
+                _rounded(group_mean, 4),
+                _rounded(global_axis_mean, 4),
+                _rounded(group_mean - global_axis_mean, 4),
+                correct.tolist(),
+                _rounded(t_stat, 4),
+                _rounded(t_p, 6),
+                passed.tolist(),
+            )))
+
         test_results = []
         axes_with_pass = defaultdict(list)
+        for k, ((entity_type, axis_name, direction, description), rows) in enumerate(
+            zip(ENTITY_TYPE_AXIS_MAPPINGS, type_rows)
+        ):
+            n_entities = len(self._get_entities_by_type(entity_type))
 
-        for entity_type, axis_name, direction, description in ENTITY_TYPE_AXIS_MAPPINGS:
-            axis_idx = AXES.index(axis_name)
-
-            # Get entities of this type
-            entity_names = self._get_entities_by_type(entity_type)
-
-            # Map to coordinates
-            coords = []
-            mapped_names = []
-            for e in entity_names:
-                c = self._entity_to_coordinate(e)
-                if c is not None:
-                    coords.append(c)
-                    mapped_names.append(e)
-
-            if len(coords) < 3:
+            if k not in columns:
                 test_results.append({
                     "entity_type": entity_type,
                     "axis": axis_name,
                     "direction": direction,
                     "description": description,
-                    "n_entities": len(entity_names),
-                    "n_mapped": len(coords),
+                    "n_entities": n_entities,
+                    "n_mapped": int(rows.size),
                     "result": "SKIPPED (insufficient data)",
                     "pass": False,
                 })
                 continue
 
-            # Extract values on the target axis
-            axis_values = np.array([c[axis_idx] for c in coords])
-            group_mean = float(axis_values.mean())
-            global_axis_mean = float(global_mean[axis_idx])
-
-            # One-sample t-test
-            t_stat, t_p = ttest_1samp(axis_values, global_axis_mean)
-
-            if direction == "low":
-                correct_direction = group_mean < global_axis_mean
-            else:
-                correct_direction = group_mean > global_axis_mean
-
-            passed = t_p < 0.10 and correct_direction  # Relaxed to p<0.10 for small groups
-
+            group_mean, global_axis_mean, delta, correct_direction, t_stat, t_p, passed = columns[k]
             if passed:
                 axes_with_pass[axis_name].append(entity_type)
 
@@ -466,39 +625,47 @@ class AxisInterpretabilityTest:
                 "axis": axis_name,
                 "direction": direction,
                 "description": description,
-                "n_entities": len(entity_names),
-                "n_mapped": len(coords),
-                "group_mean": round(group_mean, 4),
-                "global_mean": round(global_axis_mean, 4),
-                "delta": round(group_mean - global_axis_mean, 4),
+                "n_entities": n_entities,
+                "n_mapped": int(rows.size),
+                "group_mean": group_mean,
+                "global_mean": global_axis_mean,
+                "delta": delta,
                 "correct_direction": correct_direction,
-                "t_statistic": round(float(t_stat), 4),
-                "p_value": round(float(t_p), 6),
+                "t_statistic": t_stat,
+                "p_value": t_p,
                 "pass": passed,
                 "result": "PASS" if passed else "FAIL",
-                "sample_entities": mapped_names[:5],
+                "sample_entities": self._entity_names[rows[:5]].tolist(),
             })
 
         return test_results, axes_with_pass
 
     def run(self) -> Dict:
-        # Compute global mean coordinates across all mapped archetypes
-        all_coords = []
-        for m in self.mapper.mappings:
-            c = self.acp.get_coordinates(m.acp_archetype_id)
-            if c is not None:
-                all_coords.append(c)
+        self._build_coordinate_index()
 
-        if len(all_coords) < 10:
+        # Compute global mean coordinates across all mapped archetypes
+        mapped_coords = self._acp_coord_mat[self._mapper_rows]
+        if np.count_nonzero(~np.isnan(mapped_coords[:, 0])) < 10:
             return {"error": "Insufficient mapped archetypes"}
 
-        global_mean = np.mean(all_coords, axis=0)
+        self._global_mean_per_axis = np.nanmean(mapped_coords, axis=0)
+        # Plain floats: indexed once per mapping in every suite
+        global_mean = self._global_mean_per_axis.tolist()
+
+        # The three suites only read the shared indexes and global_mean, and
+        # spend their time in NumPy/SciPy calls, so they run side by side
+        with ThreadPoolExecutor(max_workers=3) as ex:
+            ct_future = ex.submit(self._run_contrastive_tests)
+            et_future = ex.submit(self._run_entity_type_tests, global_mean)
+            fg_future = ex.submit(
+                self._run_mapping_set, FINE_GRAINED_MOTIF_MAPPINGS, global_mean, True
+            )
 
         # ══════════════════════════════════════════════════════════════
         # PRIMARY: Contrastive entity-type tests (hero vs deity)
         # Non-overlapping partitions with two-sample comparison — strongest signal
         # ══════════════════════════════════════════════════════════════
-        ct_results, ct_axes_pass = self._run_contrastive_tests()
+        ct_results, ct_axes_pass = ct_future.result()
 
         ct_testable = [t for t in ct_results if t["result"] != "SKIPPED (insufficient data)"]
         ct_n_passed = sum(1 for t in ct_testable if t["pass"])
@@ -508,7 +675,7 @@ class AxisInterpretabilityTest:
         # ══════════════════════════════════════════════════════════════
         # SECONDARY: One-sample entity-type tests (type mean vs global mean)
         # ══════════════════════════════════════════════════════════════
-        et_results, et_axes_pass = self._run_entity_type_tests(global_mean)
+        et_results, et_axes_pass = et_future.result()
 
         et_testable = [t for t in et_results if t["result"] != "SKIPPED (insufficient data)"]
         et_n_passed = sum(1 for t in et_testable if t["pass"])
@@ -519,9 +686,7 @@ class AxisInterpretabilityTest:
         # DIAGNOSTIC: Fine-grained Thompson code mappings
         # (limited by near-universal entity-motif overlap — diagnostic only)
         # ══════════════════════════════════════════════════════════════
-        fg_results, fg_axes_pass = self._run_mapping_set(
-            FINE_GRAINED_MOTIF_MAPPINGS, global_mean, use_exact_code=True
-        )
+        fg_results, fg_axes_pass = fg_future.result()
 
         fg_testable = [t for t in fg_results if t["result"] != "SKIPPED (insufficient data)"]
         fg_n_passed = sum(1 for t in fg_testable if t["pass"])
@@ -542,7 +707,7 @@ class AxisInterpretabilityTest:
         top_3_have_alignment = sum(1 for a in top_3 if a in combined_axes_pass)
 
         # Count axes with at least one passing test from any approach
-        axes_with_any_pass = len([a for a in set(AXES) if a in combined_axes_pass])
+        axes_with_any_pass = len(_AXES_SET & combined_axes_pass.keys())
 
         # Verdicts — contrastive and entity-type tests are the primary signal
         # Contrastive score ≥ 25% (2/8 axes show hero-deity difference) OR
@@ -583,7 +748,7 @@ class AxisInterpretabilityTest:
             "axes_with_alignments": {k: v for k, v in combined_axes_pass.items()},
             "axes_with_any_pass": axes_with_any_pass,
             "top_3_axes_aligned": top_3_have_alignment,
-            "global_means": {AXES[i]: round(float(global_mean[i]), 4) for i in range(len(AXES))},
+            "global_means": {axis: round(m, 4) for axis, m in zip(AXES, global_mean)},
             "test_results": ct_results + et_results,
             "verdicts": {
                 "interpretability_score": {
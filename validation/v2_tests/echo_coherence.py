@@ -8,14 +8,69 @@ import numpy as np
 from scipy.stats import mannwhitneyu, spearmanr
 from typing import Dict, List, Optional
 
-from integration.acp_loader import ACPLoader
-from validation.v2_tests import weighted_distance
+from integration.acp_loader import ACPLoader, AXES
+from validation.v2_tests import pair_distances
+
+
+def _smallest_k(keys: np.ndarray, k: int) -> np.ndarray:
+    """Indices of the k smallest keys in ascending order.
+
+    Equivalent to the first k of a stable sort (ties keep input order), but
+    selects candidates with a partition instead of sorting every key.
+    """
+    if k < len(keys):
+        kth = np.partition(keys, k - 1)[k - 1]
+        candidates = np.flatnonzero(keys <= kth)
+    else:
+        candidates = np.arange(len(keys))
+    return candidates[np.argsort(keys[candidates], kind="stable")][:k]
 
 
 class EchoCoherenceTest:
     def __init__(self, acp: ACPLoader):
         self.acp = acp
 
+    @staticmethod
+    def _sample_cross_tradition_pairs(rng, trad_codes: np.ndarray, size: int):
+        """Draw row pairs (i, j) uniformly from all cross-tradition pairs.
+
+        Rejection-free: i is drawn with probability proportional to the number
+        of archetypes outside its tradition, then j uniformly among those.
+        """
+        counts = np.bincount(trad_codes)
+        n_other = len(trad_codes) - counts[trad_codes]
+        total = n_other.sum()
+        if total == 0:
+            empty = np.empty(0, dtype=np.int64)
+            return empty, empty
+
+        # Rows grouped by tradition; starts[t] is where tradition t begins
+        order = np.argsort(trad_codes, kind="stable")
+        starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+
+        i = rng.choice(len(trad_codes), size=size, p=n_other / total)
+        t = trad_codes[i]
+        # Position among the other traditions, skipping over i's own block
+        k = rng.integers(0, n_other[i])
+        k = np.where(k >= starts[t], k + counts[t], k)
+        return i, order[k]
+
+    def _sample_control_pairs(self, rng, traditions: List[str],
+                              echo_hashes: np.ndarray, n_control: int):
+        """Sample n_control cross-tradition pairs that are not echo pairs.
+
+        Draws one 4x oversampled batch of cross-tradition pairs, drops echo
+        pairs with a single mask and keeps the first n_control survivors.
+        echo_hashes holds i * n + j for both orientations of every echo
+        pair, with n = len(traditions). Returns (I, J) row-index arrays.
+        """
+        code_of = {}
+        trad_codes = np.array([code_of.setdefault(t, len(code_of)) for t in traditions], dtype=np.int64)
+
+        ci, cj = self._sample_cross_tradition_pairs(rng, trad_codes, n_control * 4)
+        keep = ~np.isin(ci * len(traditions) + cj, echo_hashes)
+        return ci[keep][:n_control], cj[keep][:n_control]
+
     def run(self, seed: int = 42) -> Dict:
         """Run the CULTURAL_ECHO distance coherence test.
 
@@ -24,65 +79,71 @@ class EchoCoherenceTest:
         """
         rng = np.random.default_rng(seed)
 
+        # Dense coordinate matrix over all archetypes with coordinates;
+        # id_to_row doubles as the "has coordinates" test below
+        all_ids = []
+        traditions = []
+        coord_rows = []
+        for aid, arch in self.acp.archetypes.items():
+            c = self.acp.get_coordinates(aid)
+            if c is not None:
+                all_ids.append(aid)
+                traditions.append(arch.get("systemCode", arch.get("belongsToSystem", "unknown")))
+                coord_rows.append(c)
+        # float32 halves memory traffic for the distance passes; distances
+        # are upcast to float64 before the SciPy tests
+        coord_mat = np.array(coord_rows, dtype=np.float32).reshape(-1, len(AXES))
+        id_to_row = {aid: row for row, aid in enumerate(all_ids)}
+
         # 1. Extract all CULTURAL_ECHO relationships
         echoes = self.acp.get_all_relationships(type_filter="CULTURAL_ECHO")
 
         # Filter to pairs where both source and target have coordinates
-        valid_echoes = []
+        valid_rels = []
+        echo_src, echo_tgt = [], []
         for rel in echoes:
-            c1 = self.acp.get_coordinates(rel["source"])
-            c2 = self.acp.get_coordinates(rel.get("target", ""))
-            if c1 is not None and c2 is not None:
-                dist = float(np.linalg.norm(c1 - c2))
-                fidelity = rel.get("fidelity", None)
-                valid_echoes.append({
-                    "source": rel["source"],
-                    "target": rel["target"],
-                    "source_name": self.acp.archetypes.get(rel["source"], {}).get("name", rel["source"]),
-                    "target_name": self.acp.archetypes.get(rel.get("target", ""), {}).get("name", rel.get("target", "")),
-                    "fidelity": fidelity,
-                    "distance": dist,
-                })
+            r1 = id_to_row.get(rel["source"])
+            r2 = id_to_row.get(rel.get("target", ""))
+            if r1 is not None and r2 is not None:
+                valid_rels.append(rel)
+                echo_src.append(r1)
+                echo_tgt.append(r2)
+        echo_src = np.array(echo_src, dtype=np.int64)
+        echo_tgt = np.array(echo_tgt, dtype=np.int64)
+
+        # Plain and weighted echo distances in one pass over the pairs
+        echo_plain, echo_weighted = pair_distances(coord_mat, echo_src, echo_tgt)
+
+        valid_echoes = []
+        for rel, dist in zip(valid_rels, echo_plain.tolist()):
+            valid_echoes.append({
+                "source": rel["source"],
+                "target": rel["target"],
+                "source_name": self.acp.archetypes.get(rel["source"], {}).get("name", rel["source"]),
+                "target_name": self.acp.archetypes.get(rel["target"], {}).get("name", rel["target"]),
+                "fidelity": rel.get("fidelity", None),
+                "distance": dist,
+            })
 
         if len(valid_echoes) < 5:
             return {"error": f"Only {len(valid_echoes)} valid echo pairs found", "pass": False}
 
-        echo_distances = np.array([e["distance"] for e in valid_echoes])
+        echo_distances = echo_plain.astype(np.float64)
 
         # 2. Build control group: random cross-tradition pairs with no echo relationship
-        echo_pair_set = set()
-        for e in valid_echoes:
-            echo_pair_set.add((e["source"], e["target"]))
-            echo_pair_set.add((e["target"], e["source"]))
-
-        # Get all archetypes with coordinates grouped by tradition
-        arch_traditions = {}
-        for aid, arch in self.acp.archetypes.items():
-            if self.acp.get_coordinates(aid) is not None:
-                system = arch.get("systemCode", arch.get("belongsToSystem", "unknown"))
-                arch_traditions[aid] = system
+        # Integer pair hashes (row_i * n + row_j), both orientations
+        n_ids = len(all_ids)
+        echo_hashes = np.concatenate((echo_src * n_ids + echo_tgt, echo_tgt * n_ids + echo_src))
 
-        all_ids = list(arch_traditions.keys())
         n_control = len(valid_echoes) * 3  # 3x oversampling for statistical power
 
-        control_distances = []
-        attempts = 0
-        while len(control_distances) < n_control and attempts < n_control * 20:
-            i, j = rng.choice(len(all_ids), size=2, replace=False)
-            id1, id2 = all_ids[i], all_ids[j]
-            # Must be cross-tradition and not an echo pair
-            if arch_traditions[id1] == arch_traditions[id2]:
-                attempts += 1
-                continue
-            if (id1, id2) in echo_pair_set:
-                attempts += 1
-                continue
-            c1 = self.acp.get_coordinates(id1)
-            c2 = self.acp.get_coordinates(id2)
-            control_distances.append(float(np.linalg.norm(c1 - c2)))
-            attempts += 1
-
-        control_arr = np.array(control_distances)
+        # One cross-tradition, non-echo control sample shared by the
+        # unweighted and weighted comparisons
+        ctrl_i, ctrl_j = self._sample_control_pairs(
+            rng, traditions, echo_hashes, n_control
+        )
+        ctrl_plain, ctrl_weighted = pair_distances(coord_mat, ctrl_i, ctrl_j)
+        control_arr = ctrl_plain.astype(np.float64)
 
         # 3. Mann-Whitney U test: echo pairs vs control
         if len(control_arr) < 5:
@@ -103,32 +164,11 @@ class EchoCoherenceTest:
             fid_r, fid_p = 0.0, 1.0
 
         # 5. Weighted distance comparison
-        w_echo_dists = []
-        for rel in echoes:
-            c1 = self.acp.get_coordinates(rel["source"])
-            c2 = self.acp.get_coordinates(rel.get("target", ""))
-            if c1 is not None and c2 is not None:
-                w_echo_dists.append(weighted_distance(c1, c2))
-
-        w_control_dists = []
-        rng2 = np.random.default_rng(seed)
-        attempts2 = 0
-        while len(w_control_dists) < n_control and attempts2 < n_control * 20:
-            i, j = rng2.choice(len(all_ids), size=2, replace=False)
-            id1, id2 = all_ids[i], all_ids[j]
-            if arch_traditions[id1] == arch_traditions[id2]:
-                attempts2 += 1
-                continue
-            if (id1, id2) in echo_pair_set:
-                attempts2 += 1
-                continue
-            c1 = self.acp.get_coordinates(id1)
-            c2 = self.acp.get_coordinates(id2)
-            w_control_dists.append(weighted_distance(c1, c2))
-            attempts2 += 1
-
-        w_echo_arr = np.array(w_echo_dists) if w_echo_dists else np.array([0.0])
-        w_ctrl_arr = np.array(w_control_dists) if w_control_dists else np.array([0.0])
+        w_echo_dists = echo_weighted.astype(np.float64)
+        w_control_dists = ctrl_weighted.astype(np.float64)
+
+        w_echo_arr = w_echo_dists if len(w_echo_dists) else np.array([0.0])
+        w_ctrl_arr = w_control_dists if len(w_control_dists) else np.array([0.0])
 
         if len(w_echo_arr) >= 5 and len(w_ctrl_arr) >= 5:
             w_u, w_p = mannwhitneyu(w_echo_arr, w_ctrl_arr, alternative="less")
@@ -149,22 +189,22 @@ class EchoCoherenceTest:
         distance_pass = u_p < 0.05 and cohens_d > 0.3
         fidelity_pass = float(fid_r) < -0.2 and fid_p < 0.05
 
-        # 7. Human review tables
-        sorted_by_fidelity = sorted(
-            [e for e in valid_echoes if e["fidelity"] is not None],
-            key=lambda x: x["fidelity"], reverse=True,
-        )
-        sorted_by_distance = sorted(valid_echoes, key=lambda x: x["distance"])
+        # 7. Human review tables (top 10 of each ordering, selected not sorted)
+        with_fidelity = [e for e in valid_echoes if e["fidelity"] is not None]
+        fid_keys = np.array([e["fidelity"] for e in with_fidelity], dtype=np.float64)
+        highest_fidelity = _smallest_k(-fid_keys, 10)
+        # Tail of the descending order == ascending order of the reversed list
+        lowest_fidelity = (len(fid_keys) - 1 - _smallest_k(fid_keys[::-1], 10))[::-1]
+        closest_echoes = _smallest_k(echo_distances, 10)
 
         # Worst violators: high fidelity but large distance
-        worst_violators = sorted(
-            [e for e in valid_echoes if e["fidelity"] is not None and e["fidelity"] >= 0.7],
-            key=lambda x: x["distance"], reverse=True,
-        )
+        violators = [e for e in with_fidelity if e["fidelity"] >= 0.7]
+        viol_keys = np.array([e["distance"] for e in violators], dtype=np.float64)
+        worst_violators = _smallest_k(-viol_keys, 10)
 
         return {
             "n_echo_pairs": len(valid_echoes),
-            "n_control_pairs": len(control_distances),
+            "n_control_pairs": len(control_arr),
             "echo_distance": {
                 "mean": round(float(echo_distances.mean()), 4),
                 "median": round(float(np.median(echo_distances)), 4),
@@ -200,9 +240,9 @@ class EchoCoherenceTest:
             },
             "weighted_comparison": weighted_section,
             "human_review": {
-                "highest_fidelity": sorted_by_fidelity[:10],
-                "lowest_fidelity": sorted_by_fidelity[-10:] if len(sorted_by_fidelity) > 10 else sorted_by_fidelity,
-                "closest_echoes": sorted_by_distance[:10],
-                "worst_violators": worst_violators[:10],
+                "highest_fidelity": [with_fidelity[i] for i in highest_fidelity],
+                "lowest_fidelity": [with_fidelity[i] for i in lowest_fidelity],
+                "closest_echoes": [valid_echoes[i] for i in closest_echoes],
+                "worst_violators": [violators[i] for i in worst_violators],
             },
         }
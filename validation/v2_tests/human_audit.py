@@ -5,48 +5,148 @@ review. Each case presents ACP's claim about a relationship or neighbor,
 and a reviewer marks AGREE / DISAGREE / UNSURE.
 """
 import json
+import math
 import numpy as np
+from collections import Counter
 from pathlib import Path
+from scipy.spatial import cKDTree
+from scipy.spatial.distance import pdist
 from typing import Dict, List, Optional
 
 from integration.acp_loader import ACPLoader, AXES
 
+try:
+    import orjson  # optional: much faster indented JSON encoding
+except ImportError:
+    orjson = None
+
 
 class HumanAuditTest:
     def __init__(self, acp: ACPLoader):
         self.acp = acp
+        self._dominant_pid = None
+        self._summary_cache: Dict[str, Dict] = {}  # reset by each run()
+
+    def _build_coordinate_index(self):
+        """Cache every archetype's coordinates as one (N, 8) matrix.
+
+        Sets self._ids (row -> archetype id), self._id_to_row,
+        self._coords (NaN rows for archetypes without coordinates) and
+        self._has_coords, the set of ids that do have coordinates.
+        """
+        ids = list(self.acp.archetypes)
+        coords = np.full((len(ids), len(AXES)), np.nan)
+        for row, arch_id in enumerate(ids):
+            c = self.acp.get_coordinates(arch_id)
+            if c is not None:
+                coords[row] = c
+        self._ids = ids
+        self._id_to_row = {arch_id: row for row, arch_id in enumerate(ids)}
+        self._coords = coords
+        # Scratch buffer for per-pair differences in _pair_entry
+        self._diff = np.empty(len(AXES))
+        self._has_coords = {
+            arch_id for arch_id, valid in zip(ids, ~np.isnan(coords[:, 0])) if valid
+        }
+
+    def _dominant_primordials(self) -> Dict[str, str]:
+        """Map each instantiating archetype to its highest-weight primordial.
+
+        Built on first use and reused by later runs.
+        """
+        if self._dominant_pid is None:
+            self._dominant_pid = {}
+            for arch_id in self.acp.archetypes:
+                insts = self.acp.get_instantiations(arch_id)
+                if insts:
+                    dominant = max(insts, key=lambda x: x.get("weight", 0))
+                    self._dominant_pid[arch_id] = dominant.get("primordial", "")
+        return self._dominant_pid
+
+    def _rank_neighbors(self, row: int, hits: np.ndarray, radius: float) -> List[tuple]:
+        """Order KD-tree ball hits around row the way acp.get_nearby does.
+
+        Distances are recomputed with get_nearby's arithmetic and cut at
+        radius, so pairs on the boundary are kept or dropped as it would.
+        Returns (other_id, distance) pairs excluding row itself, nearest
+        first, ties in archetype order.
+        """
+        base = self._coords[row]
+        ranked = []
+        for other in np.sort(hits[hits != row]).tolist():
+            diff = base - self._coords[other]
+            dist = math.sqrt(diff @ diff)
+            if dist <= radius:
+                ranked.append((self._ids[other], dist))
+        ranked.sort(key=lambda x: x[1])
+        return ranked
+
+    def _nearby_rows(self, rows: List[int], radius: float) -> List[List[tuple]]:
+        """Neighbors within radius of each row, ranked as acp.get_nearby ranks them."""
+        if not rows:
+            return []
+        # KD-tree over the archetypes that have coordinates.  The ball query
+        # is padded slightly; _rank_neighbors applies the exact cutoff
+        tree_rows = np.flatnonzero(~np.isnan(self._coords[:, 0]))
+        tree = cKDTree(self._coords[tree_rows])
+        hit_lists = tree.query_ball_point(self._coords[rows], r=radius + 1e-9)
+        return [
+            self._rank_neighbors(row, tree_rows[hits], radius)
+            for row, hits in zip(rows, hit_lists)
+        ]
+
+    def _coord(self, arch_id: str) -> Optional[np.ndarray]:
+        """Cached coordinates for an archetype, or None if it has none."""
+        if arch_id not in self._has_coords:
+            return None
+        return self._coords[self._id_to_row[arch_id]]
 
     def _archetype_summary(self, arch_id: str) -> Dict:
-        """Build a human-readable summary of an archetype."""
+        """Build a human-readable summary of an archetype.
+
+        Memoized per run(); archetypes recur across cases.
+        """
+        summary = self._summary_cache.get(arch_id)
+        if summary is not None:
+            return summary
+
         arch = self.acp.archetypes.get(arch_id, {})
-        coords = self.acp.get_coordinates(arch_id)
+        coords = self._coord(arch_id)
         insts = self.acp.get_instantiations(arch_id)
-        return {
+        summary = {
             "id": arch_id,
             "name": arch.get("name", arch_id),
             "system": arch.get("systemCode", arch.get("belongsToSystem", "unknown")),
             "description": arch.get("description", "")[:200],
-            "coordinates": {
-                AXES[i]: round(float(coords[i]), 4) for i in range(len(AXES))
-            } if coords is not None else None,
+            "coordinates": (
+                {axis: round(v, 4) for axis, v in zip(AXES, coords.tolist())}
+                if coords is not None else None
+            ),
             "primordials": [
                 {"primordial": inst.get("primordial", ""), "weight": inst.get("weight", 0)}
                 for inst in insts
             ],
             "domains": arch.get("domains", [])[:5],
         }
+        self._summary_cache[arch_id] = summary
+        return summary
 
     def _pair_entry(self, source_id: str, target_id: str, category: str, claim: str, **extra) -> Dict:
         """Build a structured audit case for a pair."""
-        c1 = self.acp.get_coordinates(source_id)
-        c2 = self.acp.get_coordinates(target_id)
-        dist = float(np.linalg.norm(c1 - c2)) if c1 is not None and c2 is not None else None
+        c1 = self._coord(source_id)
+        c2 = self._coord(target_id)
+        dist = None
         per_axis = {}
         if c1 is not None and c2 is not None:
-            per_axis = {
-                AXES[i]: round(abs(float(c1[i] - c2[i])), 4)
-                for i in range(len(AXES))
-            }
+            diff = np.subtract(c1, c2, out=self._diff)
+            np.abs(diff, out=diff)
+            if not diff.any():
+                # Identical coordinates (same archetype or exact duplicate)
+                dist = 0.0
+                per_axis = dict.fromkeys(AXES, 0.0)
+            else:
+                dist = float(np.sqrt(diff @ diff))
+                per_axis = {axis: round(d, 4) for axis, d in zip(AXES, diff.tolist())}
 
         entry = {
             "category": category,
@@ -63,21 +163,24 @@ class HumanAuditTest:
 
     def run(self, seed: int = 42) -> Dict:
         rng = np.random.default_rng(seed)
+        self._build_coordinate_index()
+        self._summary_cache = {}
 
         cases = []
+        has_coords = self._has_coords
 
         # --- 10 CULTURAL_ECHO pairs (stratified by fidelity) ---
         echoes = self.acp.get_all_relationships(type_filter="CULTURAL_ECHO")
         valid_echoes = [
             r for r in echoes
-            if self.acp.get_coordinates(r["source"]) is not None
-            and self.acp.get_coordinates(r.get("target", "")) is not None
+            if r["source"] in has_coords and r.get("target", "") in has_coords
             and r.get("fidelity") is not None
         ]
 
-        high_fid = [r for r in valid_echoes if r.get("fidelity", 0) >= 0.85]
-        med_fid = [r for r in valid_echoes if 0.5 <= r.get("fidelity", 0) < 0.85]
-        low_fid = [r for r in valid_echoes if r.get("fidelity", 0) < 0.5]
+        high_fid, med_fid, low_fid = [], [], []
+        for r in valid_echoes:
+            f = r.get("fidelity", 0)
+            (high_fid if f >= 0.85 else med_fid if f >= 0.5 else low_fid).append(r)
 
         def sample_echoes(pool, n):
             if len(pool) <= n:
@@ -116,8 +219,7 @@ class HumanAuditTest:
         polars = self.acp.get_all_relationships(type_filter="POLAR_OPPOSITE")
         valid_polars = [
             r for r in polars
-            if self.acp.get_coordinates(r["source"]) is not None
-            and self.acp.get_coordinates(r.get("target", "")) is not None
+            if r["source"] in has_coords and r.get("target", "") in has_coords
         ]
 
         # Try to pick from different axes
@@ -126,16 +228,23 @@ class HumanAuditTest:
             axis = r.get("axis", "unknown")
             axis_buckets.setdefault(axis, []).append(r)
 
-        polar_samples = []
-        for axis, bucket in axis_buckets.items():
-            if len(polar_samples) >= 5:
-                break
-            polar_samples.append(bucket[rng.integers(len(bucket))])
-        # Fill remaining from any
-        while len(polar_samples) < 5 and valid_polars:
-            r = valid_polars[rng.integers(len(valid_polars))]
-            if r not in polar_samples:
-                polar_samples.append(r)
+        # One pick from each of the first 5 axis buckets, drawn in one call
+        buckets = list(axis_buckets.values())[:5]
+        picks = rng.integers(0, [len(b) for b in buckets]) if buckets else []
+        polar_samples = [bucket[k] for bucket, k in zip(buckets, picks)]
+        # Relationship dicts are tracked by identity, not dict equality
+        seen = {id(r) for r in polar_samples}
+        # Fill remaining from any, visiting each relationship at most once
+        if len(polar_samples) < 5 and valid_polars:
+            order = iter(rng.permutation(len(valid_polars)))
+            while len(polar_samples) < 5:
+                k = next(order, None)
+                if k is None:
+                    break
+                r = valid_polars[k]
+                if id(r) not in seen:
+                    polar_samples.append(r)
+                    seen.add(id(r))
 
         for r in polar_samples[:5]:
             cases.append(self._pair_entry(
@@ -151,8 +260,7 @@ class HumanAuditTest:
         complements = self.acp.get_all_relationships(type_filter="COMPLEMENT")
         valid_complements = [
             r for r in complements
-            if self.acp.get_coordinates(r["source"]) is not None
-            and self.acp.get_coordinates(r.get("target", "")) is not None
+            if r["source"] in has_coords and r.get("target", "") in has_coords
         ]
         comp_sample = sample_echoes(valid_complements, 5)
         for r in comp_sample:
@@ -166,13 +274,14 @@ class HumanAuditTest:
 
         # --- 5 nearest-neighbor cases ---
         target_names = ["Zeus", "Odin", "Isis", "Quetzalcoatl", "Shiva"]
+        targets = []
         for name in target_names:
             matches = self.acp.find_by_name(name)
-            if not matches:
-                continue
-            arch_id = matches[0]["id"]
-            neighbors = self.acp.get_nearby(arch_id, threshold=0.5)[:3]
-            for neighbor_id, neighbor_dist in neighbors:
+            if matches and matches[0]["id"] in has_coords:
+                targets.append((name, matches[0]["id"]))
+        rows = [self._id_to_row[arch_id] for _, arch_id in targets]
+        for (name, arch_id), nearby in zip(targets, self._nearby_rows(rows, 0.5)):
+            for neighbor_id, neighbor_dist in nearby[:3]:
                 cases.append(self._pair_entry(
                     arch_id, neighbor_id,
                     category="NEAREST_NEIGHBOR",
@@ -181,31 +290,22 @@ class HumanAuditTest:
 
         # --- 5 most-distant-same-primordial cases ---
         primordial_members = {}
-        for arch_id in self.acp.archetypes:
-            insts = self.acp.get_instantiations(arch_id)
-            if not insts:
-                continue
-            dominant = max(insts, key=lambda x: x.get("weight", 0))
-            pid = dominant.get("primordial", "")
-            if self.acp.get_coordinates(arch_id) is not None:
+        for arch_id, pid in self._dominant_primordials().items():
+            if arch_id in has_coords:
                 primordial_members.setdefault(pid, []).append(arch_id)
 
         distant_same = []
         for pid, members in primordial_members.items():
             if len(members) < 2:
                 continue
-            max_dist = 0
-            max_pair = None
-            for i in range(len(members)):
-                c1 = self.acp.get_coordinates(members[i])
-                for j in range(i + 1, len(members)):
-                    c2 = self.acp.get_coordinates(members[j])
-                    d = float(np.linalg.norm(c1 - c2))
-                    if d > max_dist:
-                        max_dist = d
-                        max_pair = (members[i], members[j], pid, d)
-            if max_pair:
-                distant_same.append(max_pair)
+            # All pairwise distances in the bucket at once; the condensed
+            # order matches the (i < j) loop order, so argmax keeps the
+            # first of any tied pairs
+            dists = pdist(self._coords[[self._id_to_row[a] for a in members]])
+            k = int(dists.argmax())
+            if dists[k] > 0:
+                i, j = np.triu_indices(len(members), 1)
+                distant_same.append((members[i[k]], members[j[k]], pid, float(dists[k])))
 
         distant_same.sort(key=lambda x: x[3], reverse=True)
         for src, tgt, pid, d in distant_same[:5]:
@@ -216,11 +316,12 @@ class HumanAuditTest:
                 primordial=pid,
             ))
 
-        # Summary
+        # Summary: category names are "<CATEGORY>" or "<CATEGORY> (<detail>)"
+        category_counts = Counter(c["category"].split(" ")[0] for c in cases)
         return {
             "n_cases": len(cases),
             "cases_by_category": {
-                cat: sum(1 for c in cases if c["category"].startswith(cat))
+                cat: category_counts[cat]
                 for cat in ["CULTURAL_ECHO", "POLAR_OPPOSITE", "COMPLEMENT", "NEAREST_NEIGHBOR", "DISTANT_SAME_PRIMORDIAL"]
             },
             "cases": cases,
@@ -240,20 +341,27 @@ class HumanAuditTest:
         }
 
     def save_audit(self, results: Dict, output_dir: str) -> str:
-        """Save audit cases to JSON for human review."""
+        """Save audit cases to JSON for human review.
+
+        run() emits only native Python types, so no fallback encoder is needed.
+        """
         out = Path(output_dir)
         out.mkdir(parents=True, exist_ok=True)
         path = out / "human_audit_cases.json"
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(results, f, indent=2, ensure_ascii=False, default=str)
+        if orjson is not None:
+            path.write_bytes(orjson.dumps(results, option=orjson.OPT_INDENT_2))
+        else:
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(results, f, indent=2, ensure_ascii=False)
         return str(path)
 
     def score_audit(self, results: Dict) -> Dict:
         """Score a completed audit (after human fills in reviewer_judgment)."""
         cases = results.get("cases", [])
-        agree = sum(1 for c in cases if c.get("reviewer_judgment") == "AGREE")
-        disagree = sum(1 for c in cases if c.get("reviewer_judgment") == "DISAGREE")
-        unsure = sum(1 for c in cases if c.get("reviewer_judgment") == "UNSURE")
+        judgments = Counter(c.get("reviewer_judgment") for c in cases)
+        agree = judgments["AGREE"]
+        disagree = judgments["DISAGREE"]
+        unsure = judgments["UNSURE"]
         total_judged = agree + disagree + unsure
 
         if total_judged == 0:
@@ -11,6 +11,7 @@ from collections import defaultdict
 from typing import Dict, List, Optional, Tuple
 
 from scipy.stats import kruskal, mannwhitneyu, spearmanr, f_oneway
+from scipy.cluster.vq import kmeans2
 from scipy.spatial.distance import pdist, squareform
 
 from integration.acp_loader import ACPLoader, AXES
@@ -20,50 +21,78 @@ from integration.miroglyph_loader import MiroGlyphLoader
 from integration.node_profiler import NodeProfiler, ARC_PATTERN_MAPPING, MIN_SEGMENTS_PER_TEXT
 
 
-def _silhouette_score(coords: np.ndarray, labels: np.ndarray) -> float:
-    """Compute mean silhouette score without sklearn dependency."""
+# Above this many points, silhouette scores are computed on a random subsample
+SILHOUETTE_MAX_N = 5000
+
+# All 15 ways to split conditions 1-6 into three pairs, in lexicographic order
+PERFECT_MATCHINGS_6 = [
+    ((1, 2), (3, 4), (5, 6)), ((1, 2), (3, 5), (4, 6)), ((1, 2), (3, 6), (4, 5)),
+    ((1, 3), (2, 4), (5, 6)), ((1, 3), (2, 5), (4, 6)), ((1, 3), (2, 6), (4, 5)),
+    ((1, 4), (2, 3), (5, 6)), ((1, 4), (2, 5), (3, 6)), ((1, 4), (2, 6), (3, 5)),
+    ((1, 5), (2, 3), (4, 6)), ((1, 5), (2, 4), (3, 6)), ((1, 5), (2, 6), (3, 4)),
+    ((1, 6), (2, 3), (4, 5)), ((1, 6), (2, 4), (3, 5)), ((1, 6), (2, 5), (3, 4)),
+]
+
+
+def _silhouette_score(
+    coords: np.ndarray, labels: np.ndarray, dist_condensed: Optional[np.ndarray] = None,
+) -> float:
+    """Compute mean silhouette score without sklearn dependency.
+
+    Pass ``dist_condensed`` (``pdist(coords)``) to reuse distances the caller
+    already has.
+    """
     n = len(coords)
     if n < 3:
         return 0.0
 
-    unique_labels = np.unique(labels)
-    if len(unique_labels) < 2:
+    unique_labels, label_idx = np.unique(labels, return_inverse=True)
+    k = len(unique_labels)
+    if k < 2:
         return 0.0
 
-    dist_matrix = squareform(pdist(coords))
-    silhouettes = []
+    # The square matrix is only needed for the matmul below; store it as
+    # float32 to halve its footprint, and do the per-point arithmetic in float64
+    if dist_condensed is None:
+        dist_condensed = pdist(coords)
+    dist_matrix = squareform(dist_condensed.astype(np.float32))
 
-    for i in range(n):
-        own_label = labels[i]
-        own_mask = labels == own_label
-        own_count = own_mask.sum()
+    # Summed distance from every point to every cluster in one matmul
+    onehot = np.eye(k, dtype=np.float32)[label_idx]
+    sums = (dist_matrix @ onehot).astype(np.float64)
+    counts = np.bincount(label_idx, minlength=k)
+    rows = np.arange(n)
 
-        # a(i) = mean distance to same-cluster points
-        if own_count > 1:
-            a_i = dist_matrix[i][own_mask].sum() / (own_count - 1)
-        else:
-            a_i = 0.0
+    # a(i) = mean distance to same-cluster points (0 for singletons)
+    own_count = counts[label_idx]
+    a = np.where(own_count > 1, sums[rows, label_idx] / np.maximum(own_count - 1, 1), 0.0)
 
-        # b(i) = min mean distance to any other cluster
-        b_i = float("inf")
-        for lbl in unique_labels:
-            if lbl == own_label:
-                continue
-            other_mask = labels == lbl
-            other_count = other_mask.sum()
-            if other_count == 0:
-                continue
-            mean_dist = dist_matrix[i][other_mask].mean()
-            b_i = min(b_i, mean_dist)
+    # b(i) = min mean distance to any other cluster
+    mean_dists = sums / counts
+    mean_dists[rows, label_idx] = np.inf
+    b = mean_dists.min(axis=1)
 
-        if b_i == float("inf"):
-            b_i = 0.0
+    denom = np.maximum(a, b)
+    silhouettes = np.where(denom > 0, (b - a) / np.where(denom > 0, denom, 1.0), 0.0)
 
-        denom = max(a_i, b_i)
-        s_i = (b_i - a_i) / denom if denom > 0 else 0.0
-        silhouettes.append(s_i)
+    return float(silhouettes.mean())
 
-    return float(np.mean(silhouettes))
+
+def _silhouette_subsampled(
+    coords: np.ndarray, labels: np.ndarray,
+    dist_condensed: Optional[np.ndarray] = None,
+    max_n: int = SILHOUETTE_MAX_N, seed: int = 0,
+) -> float:
+    """Silhouette score on a fixed-size random subsample when N exceeds max_n.
+
+    The full score is O(N^2); a few thousand points already pin it down to
+    about two decimal places.  ``dist_condensed`` is only used unsampled.
+    """
+    n = len(coords)
+    if n <= max_n:
+        return _silhouette_score(coords, labels, dist_condensed)
+    idx = np.random.default_rng(seed).choice(n, max_n, replace=False)
+    return _silhouette_score(coords[idx], labels[idx])
 
 
 class MiroStructureTest:
@@ -82,10 +111,14 @@ class MiroStructureTest:
         self.mapper = mapper
         self.miroglyph = miroglyph
         self.profiler = profiler
+        self._coord_cache: Dict[str, Optional[np.ndarray]] = {}
+        self._pattern_motif_codes: Optional[Dict[str, List[str]]] = None
+        self._condition_profiles: Optional[Dict] = None
 
     def run(self) -> Dict:
         """Run all 4 Miroglyph structure tests."""
         results = {}
+        self._coord_cache = {}
 
         print("    Test 7: Arc Separation...")
         results["test7_arc_separation"] = self._test_arc_separation()
@@ -97,13 +130,43 @@ class MiroStructureTest:
         results["test9_polarity_pairs"] = self._test_polarity_pairs()
 
         print("    Test 10: Structural Optimality...")
-        results["test10_structural_optimality"] = self._test_structural_optimality()
+        results["test10_structural_optimality"] = self._test_structural_optimality(
+            results["test7_arc_separation"],
+            results["test8_condition_progression"],
+            results["test9_polarity_pairs"],
+        )
 
         # Compute verdicts
         results["verdicts"] = self._compute_verdicts(results)
 
         return results
 
+    def _coord_for(self, ent_name: str) -> Optional[np.ndarray]:
+        """ACP coordinates of a library entity's mapped archetype, cached per run.
+
+        EntityMapper.get_mapping scans every mapping, and the same entities
+        recur across patterns and segments.  Stored as float32; the 8 axes
+        are bounded scores and the statistics upcast where they accumulate.
+        """
+        if ent_name in self._coord_cache:
+            return self._coord_cache[ent_name]
+        mapping = self.mapper.get_mapping(ent_name)
+        c = self.acp.get_coordinates(mapping.acp_archetype_id) if mapping else None
+        if c is not None:
+            c = np.asarray(c, dtype=np.float32)
+        self._coord_cache[ent_name] = c
+        return c
+
+    def _arc_pattern_codes(self) -> Dict[str, List[str]]:
+        """Motif codes for every pattern in ARC_PATTERN_MAPPING, looked up once."""
+        if self._pattern_motif_codes is None:
+            self._pattern_motif_codes = {
+                pname: self.library.get_pattern_motif_codes(pname)
+                for pattern_names in ARC_PATTERN_MAPPING.values()
+                for pname in pattern_names
+            }
+        return self._pattern_motif_codes
+
     # ── Test 7: Arc Separation ──
 
     def _test_arc_separation(self) -> dict:
@@ -118,20 +181,19 @@ class MiroStructureTest:
         # ── Build per-pattern centroids grouped by arc ──
         pattern_centroids = {}  # pattern_name -> (arc, centroid, n_entities)
         arc_centroids = defaultdict(list)  # arc_code -> list of centroid vectors
+        pattern_codes = self._arc_pattern_codes()
 
         for arc_code, pattern_names in ARC_PATTERN_MAPPING.items():
             for pname in pattern_names:
-                codes = self.library.get_pattern_motif_codes(pname)
+                codes = pattern_codes[pname]
                 entities = self.library.get_entities_for_motif_codes(codes)
                 coords = []
                 for ent in entities:
-                    mapping = self.mapper.get_mapping(ent)
-                    if mapping:
-                        c = self.acp.get_coordinates(mapping.acp_archetype_id)
-                        if c is not None:
-                            coords.append(c)
+                    c = self._coord_for(ent)
+                    if c is not None:
+                        coords.append(c)
                 if coords:
-                    centroid = np.mean(coords, axis=0)
+                    centroid = np.mean(coords, axis=0, dtype=np.float64)
                     pattern_centroids[pname] = {
                         "arc": arc_code,
                         "centroid": centroid,
@@ -150,59 +212,52 @@ class MiroStructureTest:
         if len(all_centroids) < 6:
             return {"error": "Too few pattern centroids", "pass": False}
 
-        all_coords = np.array(all_centroids)
+        all_coords = np.array(all_centroids, dtype=np.float32)
         all_labels_arr = np.array(all_labels)
         n_patterns = {"D": len(arc_centroids.get("D", [])),
                       "R": len(arc_centroids.get("R", [])),
                       "E": len(arc_centroids.get("E", []))}
 
         # ── Within-arc vs between-arc centroid distances ──
-        label_to_idx = defaultdict(list)
-        for i, lbl in enumerate(all_labels):
-            label_to_idx[lbl].append(i)
-
-        dist_matrix = squareform(pdist(all_coords))
-
-        within_dists = []
-        between_dists = []
-        for lbl, indices in label_to_idx.items():
-            for i in range(len(indices)):
-                for j in range(i + 1, len(indices)):
-                    within_dists.append(dist_matrix[indices[i]][indices[j]])
-
-        labels_list = list(label_to_idx.keys())
-        for a in range(len(labels_list)):
-            for b in range(a + 1, len(labels_list)):
-                for i in label_to_idx[labels_list[a]]:
-                    for j in label_to_idx[labels_list[b]]:
-                        between_dists.append(dist_matrix[i][j])
-
-        within_arr = np.array(within_dists) if within_dists else np.array([0.0])
-        between_arr = np.array(between_dists) if between_dists else np.array([0.0])
+        # Integer codes are only compared for equality, so their order is irrelevant
+        _, numeric_labels = np.unique(all_labels_arr, return_inverse=True)
+
+        # Condensed pdist order matches the upper-triangle (i < j) pairs
+        dists = pdist(all_coords)
+        iu, ju = np.triu_indices(len(numeric_labels), k=1)
+        same_arc = numeric_labels[iu] == numeric_labels[ju]
+        within_arr = dists[same_arc]
+        between_arr = dists[~same_arc]
+        if len(within_arr) == 0:
+            within_arr = np.array([0.0])
+        if len(between_arr) == 0:
+            between_arr = np.array([0.0])
 
         # Mann-Whitney: are between-arc distances > within-arc distances?
+        # Pair counts grow quadratically, so skip the exact-distribution dispatch
         if len(within_arr) > 1 and len(between_arr) > 1:
-            stat_mw, p_mw = mannwhitneyu(between_arr, within_arr, alternative="greater")
+            stat_mw, p_mw = mannwhitneyu(
+                between_arr, within_arr, alternative="greater", method="asymptotic",
+            )
         else:
             stat_mw, p_mw = 0.0, 1.0
 
         # ── Per-axis Kruskal-Wallis ──
         groups = [np.array(arc_centroids[k]) for k in ["D", "R", "E"]
                   if len(arc_centroids.get(k, [])) > 0]
+        # Arcs with a single pattern centroid carry no spread for the test
+        group_arrays = [g for g in groups if g.shape[0] > 1]
         axis_kw = {}
         if len(groups) >= 2:
             for ax_idx, ax_name in enumerate(AXES):
-                ax_groups = [g[:, ax_idx] for g in groups if g.shape[0] > 1]
-                if len(ax_groups) >= 2:
-                    stat_kw, p_kw = kruskal(*ax_groups)
+                if len(group_arrays) >= 2:
+                    stat_kw, p_kw = kruskal(*[g[:, ax_idx] for g in group_arrays])
                     axis_kw[ax_name] = {"H": float(stat_kw), "p": float(p_kw)}
                 else:
                     axis_kw[ax_name] = {"H": 0.0, "p": 1.0}
 
         # ── Silhouette score for k=3 ──
-        label_map = {"D": 0, "R": 1, "E": 2}
-        numeric_labels = np.array([label_map[l] for l in all_labels])
-        silhouette_3 = _silhouette_score(all_coords, numeric_labels)
+        silhouette_3 = _silhouette_subsampled(all_coords, numeric_labels, dists)
 
         # Test alternative k values
         alt_silhouettes = {}
@@ -222,6 +277,7 @@ class MiroStructureTest:
             "axis_kruskal_wallis": axis_kw,
             "significant_axes": significant_axes,
             "silhouette_k3": float(silhouette_3),
+            "silhouette_sample_size": min(len(all_coords), SILHOUETTE_MAX_N),
             "alternative_silhouettes": {str(k): float(v) for k, v in alt_silhouettes.items()},
             "best_k": max(
                 [(3, silhouette_3)] + [(k, v) for k, v in alt_silhouettes.items()],
@@ -235,29 +291,13 @@ class MiroStructureTest:
         return result
 
     def _quick_kmeans_silhouette(self, coords: np.ndarray, k: int, max_iter: int = 20) -> float:
-        """Quick k-means + silhouette (no sklearn)."""
+        """Quick k-means (k-means++ seeded, via SciPy) + silhouette (no sklearn)."""
         n = len(coords)
         if n < k:
             return -1.0
 
-        rng = np.random.default_rng(42)
-        centroids = coords[rng.choice(n, k, replace=False)]
-
-        labels = np.zeros(n, dtype=int)
-        for _ in range(max_iter):
-            # Assign
-            dists = np.array([np.linalg.norm(coords - c, axis=1) for c in centroids])
-            new_labels = dists.argmin(axis=0)
-            if np.array_equal(new_labels, labels):
-                break
-            labels = new_labels
-            # Update centroids
-            for j in range(k):
-                mask = labels == j
-                if mask.sum() > 0:
-                    centroids[j] = coords[mask].mean(axis=0)
-
-        return _silhouette_score(coords, labels)
+        _, labels = kmeans2(coords, k, iter=max_iter, minit="++", seed=np.random.default_rng(42))
+        return _silhouette_subsampled(coords, labels)
 
     # ── Test 8: Condition Progression ──
 
@@ -268,51 +308,55 @@ class MiroStructureTest:
             tid for tid, cnt in seg_counts.items() if cnt >= MIN_SEGMENTS_PER_TEXT
         ]
 
-        # For each text, get per-bin entity coordinates
-        # Test with multiple bin counts
-        best_result = None
+        # Walk the segments once, recording each entity mention's position
+        ordinals: List[int] = []
+        totals: List[int] = []
+        coord_rows: List[np.ndarray] = []
+        for text_id in eligible_texts:
+            segments = self.library.get_text_segments_ordered(text_id)
+            if not segments:
+                continue
+            total = len(segments)
+            for seg in segments:
+                for ent_name in seg["entity_names"]:
+                    c = self._coord_for(ent_name)
+                    if c is not None:
+                        ordinals.append(seg["ordinal"])
+                        totals.append(total)
+                        coord_rows.append(c)
+
+        ordinals_arr = np.array(ordinals, dtype=float)
+        totals_arr = np.array(totals, dtype=float)
+        coords_arr = np.array(coord_rows, dtype=float).reshape(-1, len(AXES))
+        ratio = (ordinals_arr - 1) / np.maximum(totals_arr - 1, 1)
+
+        # Test with multiple bin counts; only the bin assignment changes
         results_by_bins = {}
 
         for n_bins in [4, 5, 6, 7, 8]:
-            bin_coords: Dict[int, List[np.ndarray]] = defaultdict(list)
-
-            for text_id in eligible_texts:
-                segments = self.library.get_text_segments_ordered(text_id)
-                if not segments:
-                    continue
-                total = len(segments)
-                for seg in segments:
-                    ordinal = seg["ordinal"]
-                    ratio = (ordinal - 1) / max(total - 1, 1)
-                    bin_idx = min(n_bins, int(ratio * n_bins) + 1)
-                    for ent_name in seg["entity_names"]:
-                        mapping = self.mapper.get_mapping(ent_name)
-                        if mapping:
-                            c = self.acp.get_coordinates(mapping.acp_archetype_id)
-                            if c is not None:
-                                bin_coords[bin_idx].append(c)
+            bin_idx = np.minimum(n_bins, (ratio * n_bins).astype(int) + 1)
+
+            # Stable sort keeps mentions in walk order within each bin
+            order = np.argsort(bin_idx, kind="stable")
+            sorted_bins = bin_idx[order]
+            sorted_coords = coords_arr[order]
+            bounds = np.searchsorted(sorted_bins, np.arange(1, n_bins + 2))
+            bin_groups = [
+                sorted_coords[lo:hi] for lo, hi in zip(bounds[:-1], bounds[1:]) if hi > lo
+            ]
+            testable = len(bin_groups) >= 2 and all(len(g) > 1 for g in bin_groups)
+            trend_bins = sorted_bins[bounds[0]:bounds[-1]]
+            trend_coords = sorted_coords[bounds[0]:bounds[-1]]
 
             # Test per-axis ANOVA across bins
             axis_results = {}
             significant_count = 0
             for ax_idx, ax_name in enumerate(AXES):
-                groups = []
-                for b in range(1, n_bins + 1):
-                    vals = [c[ax_idx] for c in bin_coords.get(b, [])]
-                    if vals:
-                        groups.append(vals)
-
-                if len(groups) >= 2 and all(len(g) > 1 for g in groups):
-                    stat_f, p_f = f_oneway(*groups)
+                if testable:
+                    stat_f, p_f = f_oneway(*[g[:, ax_idx] for g in bin_groups])
                     # Test monotonic trend (Spearman of bin_index vs axis_value)
-                    all_bins_for_axis = []
-                    all_vals_for_axis = []
-                    for b in range(1, n_bins + 1):
-                        for c in bin_coords.get(b, []):
-                            all_bins_for_axis.append(b)
-                            all_vals_for_axis.append(c[ax_idx])
-                    if len(all_bins_for_axis) > 10:
-                        r_s, p_s = spearmanr(all_bins_for_axis, all_vals_for_axis)
+                    if len(trend_bins) > 10:
+                        r_s, p_s = spearmanr(trend_bins, trend_coords[:, ax_idx])
                     else:
                         r_s, p_s = 0.0, 1.0
 
@@ -330,7 +374,7 @@ class MiroStructureTest:
                         "significant": False,
                     }
 
-            bin_sizes = {b: len(bin_coords.get(b, [])) for b in range(1, n_bins + 1)}
+            bin_sizes = {b: int(bounds[b] - bounds[b - 1]) for b in range(1, n_bins + 1)}
             results_by_bins[n_bins] = {
                 "n_bins": n_bins,
                 "bin_sizes": bin_sizes,
@@ -365,7 +409,9 @@ class MiroStructureTest:
 
     def _test_polarity_pairs(self) -> dict:
         """Test whether polarity pairs show more opposition than non-polarity pairs."""
-        condition_profiles = self.profiler.compute_condition_profiles()
+        if self._condition_profiles is None:
+            self._condition_profiles = self.profiler.compute_condition_profiles()
+        condition_profiles = self._condition_profiles
 
         # Compute distances between all condition pairs
         cond_centroids = {}
@@ -373,12 +419,14 @@ class MiroStructureTest:
             profile = condition_profiles.get(cond_code, {})
             coords = profile.get("mean_coordinates", [0.5] * 8)
             cond_centroids[cond_code] = np.array(coords)
+        cond_matrix = np.stack([cond_centroids[c] for c in range(1, 7)])
+        cond_dists = squareform(pdist(cond_matrix))
 
         # Polarity pairs: 1-6, 2-5, 3-4
         polarity_dists = []
         polarity_details = []
         for c1, c2 in [(1, 4), (2, 6), (3, 5)]:
-            d = float(np.linalg.norm(cond_centroids[c1] - cond_centroids[c2]))
+            d = float(cond_dists[c1 - 1, c2 - 1])
             polarity_dists.append(d)
             polarity_details.append({"pair": f"{c1}-{c2}", "distance": d})
 
@@ -389,7 +437,7 @@ class MiroStructureTest:
         for c1 in range(1, 7):
             for c2 in range(c1 + 1, 7):
                 if (c1, c2) not in polarity_set:
-                    d = float(np.linalg.norm(cond_centroids[c1] - cond_centroids[c2]))
+                    d = float(cond_dists[c1 - 1, c2 - 1])
                     non_polarity_dists.append(d)
                     non_polarity_details.append({"pair": f"{c1}-{c2}", "distance": d})
 
@@ -403,42 +451,32 @@ class MiroStructureTest:
             stat, p_val = 0.0, 1.0
 
         # Per-axis analysis: which axes show strongest polarity opposition?
-        axis_polarity = {}
-        for ax_idx, ax_name in enumerate(AXES):
-            diffs = []
-            for c1, c2 in [(1, 4), (2, 6), (3, 5)]:
-                diff = abs(cond_centroids[c1][ax_idx] - cond_centroids[c2][ax_idx])
-                diffs.append(float(diff))
-            axis_polarity[ax_name] = {
-                "mean_polarity_diff": float(np.mean(diffs)),
-                "max_polarity_diff": float(np.max(diffs)),
-                "pairs": {f"{c1}-{c2}": float(abs(cond_centroids[c1][ax_idx] - cond_centroids[c2][ax_idx]))
-                          for c1, c2 in [(1, 6), (2, 5), (3, 4)]},
+        # Summary stats use the polarity pairs; per-pair entries report the
+        # mirror positions 1-6, 2-5, 3-4
+        polarity_diffs = np.abs(cond_matrix[[0, 1, 2]] - cond_matrix[[3, 5, 4]])
+        mirror_diffs = np.abs(cond_matrix[[0, 1, 2]] - cond_matrix[[5, 4, 3]])
+        axis_polarity = {
+            ax_name: {
+                "mean_polarity_diff": float(polarity_diffs[:, ax_idx].mean()),
+                "max_polarity_diff": float(polarity_diffs[:, ax_idx].max()),
+                "pairs": {
+                    label: float(mirror_diffs[k, ax_idx])
+                    for k, label in enumerate(["1-6", "2-5", "3-4"])
+                },
             }
+            for ax_idx, ax_name in enumerate(AXES)
+        }
 
-        # Test alternative pairings
-        from itertools import combinations
-        all_pairings = []
-        conditions = [1, 2, 3, 4, 5, 6]
-        # Generate all possible 3-pair perfect matchings of 6 items
-        for p1 in combinations(conditions, 2):
-            remaining = [c for c in conditions if c not in p1]
-            for p2 in combinations(remaining, 2):
-                p3 = tuple(c for c in remaining if c not in p2)
-                pairing = tuple(sorted([tuple(sorted(p1)), tuple(sorted(p2)), tuple(sorted(p3))]))
-                if pairing not in all_pairings:
-                    all_pairings.append(pairing)
-
-        best_pairing = None
-        best_pairing_dist = 0.0
-        for pairing in all_pairings:
-            total_dist = sum(
-                float(np.linalg.norm(cond_centroids[p[0]] - cond_centroids[p[1]]))
-                for p in pairing
-            )
-            if total_dist > best_pairing_dist:
-                best_pairing_dist = total_dist
-                best_pairing = pairing
+        # Test alternative pairings (first maximum wins, as in lexicographic order)
+        matching_idx = np.array(PERFECT_MATCHINGS_6) - 1
+        pairing_totals = cond_dists[matching_idx[..., 0], matching_idx[..., 1]].sum(axis=1)
+        best_idx = int(np.argmax(pairing_totals))
+        if pairing_totals[best_idx] > 0.0:
+            best_pairing = PERFECT_MATCHINGS_6[best_idx]
+            best_pairing_dist = float(pairing_totals[best_idx])
+        else:
+            best_pairing = None
+            best_pairing_dist = 0.0
 
         current_pairing_dist = sum(polarity_dists)
 
@@ -464,22 +502,23 @@ class MiroStructureTest:
 
     # ── Test 10: Structural Optimality ──
 
-    def _test_structural_optimality(self) -> dict:
-        """Synthesize findings: is 3x6 optimal or would something else be better?"""
-        # Gather results from the other tests (we call their core logic)
+    def _test_structural_optimality(
+        self, arc_result: dict, cond_result: dict, polarity_result: dict,
+    ) -> dict:
+        """Synthesize findings: is 3x6 optimal or would something else be better?
+
+        Takes the already-computed results of tests 7-9 rather than re-running them.
+        """
         # Arc count analysis
-        arc_result = self._test_arc_separation()
         silhouette_3 = arc_result.get("silhouette_k3", 0.0)
         alt_silhouettes = arc_result.get("alternative_silhouettes", {})
         best_k = arc_result.get("best_k", 3)
 
         # Condition count analysis
-        cond_result = self._test_condition_progression()
         optimal_bins = cond_result.get("optimal_bins", 6)
         bins_comparison = cond_result.get("all_bin_counts", {})
 
         # Polarity analysis
-        polarity_result = self._test_polarity_pairs()
         current_polarity_optimal = polarity_result.get("current_is_optimal", False)
         best_pairing = polarity_result.get("best_pairing", None)
 
@@ -550,18 +589,21 @@ class MiroStructureTest:
         t8 = results.get("test8_condition_progression", {})
         t9 = results.get("test9_polarity_pairs", {})
         t10 = results.get("test10_structural_optimality", {})
+        cur6 = t8.get("current_bins_6", {})
+        t7_pass = t7.get("pass", False)
+        t8_pass = t8.get("pass", False)
 
         verdicts = {
             "test7_arc_separation": {
-                "pass": t7.get("pass", False),
+                "pass": t7_pass,
                 "criterion": "Between-arc distances > within-arc (p<0.05) AND silhouette > 0",
                 "detail": f"p={t7.get('mann_whitney_p', 1.0):.4f}, "
                           f"silhouette={t7.get('silhouette_k3', 0.0):.4f}",
             },
             "test8_condition_progression": {
-                "pass": t8.get("pass", False),
+                "pass": t8_pass,
                 "criterion": ">=2 axes show significant condition effect at 6 bins",
-                "detail": f"{t8.get('current_bins_6', {}).get('significant_axes', 0)} significant axes",
+                "detail": f"{cur6.get('significant_axes', 0)} significant axes",
             },
             "test9_polarity_pairs": {
                 "pass": t9.get("pass", False),
@@ -576,10 +618,7 @@ class MiroStructureTest:
         }
 
         # Tier C overall
-        tier_c_pass = (
-            verdicts["test7_arc_separation"]["pass"]
-            and verdicts["test8_condition_progression"]["pass"]
-        )
+        tier_c_pass = t7_pass and t8_pass
         verdicts["tier_c_overall"] = {
             "pass": tier_c_pass,
             "label": "PASS" if tier_c_pass else "FAIL",
@@ -22,16 +22,20 @@ Philosophy:
   or E (creator of cosmic order) - same coordinates, different lens.
 """
 import numpy as np
-from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from itertools import combinations
 from typing import Dict, List, Optional, Tuple
 
-from scipy.stats import kruskal, mannwhitneyu, spearmanr, f_oneway, chi2_contingency
+from scipy.spatial.distance import pdist
+from scipy.stats import mannwhitneyu, chi2_contingency, rankdata
+from scipy.stats import chi2 as chi2_dist, f as f_dist
 
 from integration.acp_loader import ACPLoader, AXES
 from integration.library_loader import LibraryLoader
-from integration.entity_mapper import EntityMapper
+from integration.entity_mapper import EntityMapper, EntityMapping
 from integration.miroglyph_loader import MiroGlyphLoader
 from integration.node_profiler import NodeProfiler, ARC_PATTERN_MAPPING, MIN_SEGMENTS_PER_TEXT
+from validation.v2_tests import condensed_index, spearman_from_ranks
 
 
 # ══════════════════════════════════════════════════════════════════════════════
@@ -80,6 +84,9 @@ for arc, primordials in ARC_PRIMORDIAL_ALIGNMENT.items():
     for p in primordials:
         PRIMORDIAL_TO_ARC[p] = arc
 
+# Membership sets for per-arc alignment checks
+ARC_PRIMORDIAL_SETS = {arc: frozenset(prims) for arc, prims in ARC_PRIMORDIAL_ALIGNMENT.items()}
+
 
 # ══════════════════════════════════════════════════════════════════════════════
 # ARC-AXIS SEMANTIC MAPPINGS
@@ -111,6 +118,48 @@ ARC_AXIS_ALIGNMENT = {
 AXIS_INDEX = {name: i for i, name in enumerate(AXES)}
 
 
+def _anova_columns(x: np.ndarray, groups: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """One-way ANOVA F and p for every column of x over shared group labels.
+
+    Equivalent to scipy.stats.f_oneway run column by column, but the group
+    sizes, means and sums of squares are computed for all columns together.
+    """
+    _, labels = np.unique(groups, return_inverse=True)
+    k, n = int(labels.max()) + 1, len(x)
+    counts = np.bincount(labels, minlength=k)
+    sums = np.zeros((k, x.shape[1]))
+    np.add.at(sums, labels, x)
+    means = sums / counts[:, None]
+    ss_between = (counts[:, None] * (means - x.mean(axis=0)) ** 2).sum(axis=0)
+    ss_within = ((x - means[labels]) ** 2).sum(axis=0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        f_stat = (ss_between / (k - 1)) / (ss_within / (n - k))
+    return f_stat, f_dist.sf(f_stat, k - 1, n - k)
+
+
+def _kruskal_columns(x: np.ndarray, groups: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Kruskal-Wallis H and p for every column of x over shared group labels.
+
+    Equivalent to scipy.stats.kruskal run column by column: the pooled sample
+    is ranked once for all columns and the group rank sums come from a single
+    scatter-add, with the usual tie correction applied per column.
+    """
+    _, labels = np.unique(groups, return_inverse=True)
+    k, n = int(labels.max()) + 1, len(x)
+    counts = np.bincount(labels, minlength=k)
+    ranks = rankdata(x, axis=0)
+    rank_sums = np.zeros((k, x.shape[1]))
+    np.add.at(rank_sums, labels, ranks)
+    h = 12.0 / (n * (n + 1)) * (rank_sums ** 2 / counts[:, None]).sum(axis=0) - 3 * (n + 1)
+    tie_term = np.array([
+        float((t ** 3 - t).sum())
+        for t in (np.unique(col, return_counts=True)[1].astype(np.float64) for col in x.T)
+    ])
+    with np.errstate(divide="ignore", invalid="ignore"):
+        h = h / (1 - tie_term / (n ** 3 - n))
+    return h, chi2_dist.sf(h, k - 1)
+
+
 class MiroStructureTestV2:
     """Tests 7-10 (Revised): Miroglyph structural validity with corrected premises."""
 
@@ -128,9 +177,20 @@ class MiroStructureTestV2:
         self.miroglyph = miroglyph
         self.profiler = profiler
 
+        # Pattern/arc entity index, resolved once (see _build_arc_index)
+        self._pattern_entities: Optional[Dict[str, List[str]]] = None
+        self._arc_entities: Optional[Dict[str, List[str]]] = None
+        # Per-entity lookups shared by tests 7a, 7b and 8 (see _resolve_entity)
+        self._entity_mapping: Dict[str, Optional[EntityMapping]] = {}
+        self._entity_coords: Dict[str, np.ndarray] = {}
+        self._entity_insts: Dict[str, List[Dict]] = {}
+        # Condition profiles are expensive and fixed for a run (see test 9)
+        self._condition_profiles: Optional[Dict] = None
+
     def run(self) -> Dict:
         """Run all revised Miroglyph structure tests."""
         results = {}
+        self._build_arc_index()
 
         print("    Test 7a: Arc-Primordial Thematic Alignment...")
         results["test7a_primordial_alignment"] = self._test_arc_primordial_alignment()
@@ -152,6 +212,50 @@ class MiroStructureTestV2:
 
         return results
 
+    def _build_arc_index(self):
+        """Resolve every ARC_PATTERN_MAPPING pattern to its entities once.
+
+        Tests 7a and 7b both walk the same patterns; this keeps the per-pattern
+        entity lists (7a weights repeats across patterns), the de-duplicated
+        per-arc lists in first-seen order, and each entity's mapping and
+        coordinates.
+        """
+        self._pattern_entities = {}
+        self._arc_entities = {}
+        for arc_code, pattern_names in ARC_PATTERN_MAPPING.items():
+            arc_entities: Dict[str, None] = {}
+            for pname in pattern_names:
+                codes = self.library.get_pattern_motif_codes(pname)
+                entities = self.library.get_entities_for_motif_codes(codes)
+                self._pattern_entities[pname] = entities
+                arc_entities.update(dict.fromkeys(entities))
+            self._arc_entities[arc_code] = list(arc_entities)
+
+        self._entity_mapping = {}
+        self._entity_coords = {}
+        self._entity_insts = {}
+        for entities in self._arc_entities.values():
+            for ent in entities:
+                self._resolve_entity(ent)
+
+    def _resolve_entity(self, ent: str):
+        """Cache a library entity's mapping, coordinates and instantiations.
+
+        EntityMapper.get_mapping scans every mapping; the same entities recur
+        across patterns and thousands of segment mentions.  Unmapped entities
+        are remembered too, and have no coordinates or instantiations.
+        """
+        if ent in self._entity_mapping:
+            return
+        mapping = self.mapper.get_mapping(ent)
+        self._entity_mapping[ent] = mapping
+        if not mapping:
+            return
+        coords = self.acp.get_coordinates(mapping.acp_archetype_id)
+        if coords is not None:
+            self._entity_coords[ent] = coords
+        self._entity_insts[ent] = self.acp.get_instantiations(mapping.acp_archetype_id)
+
     # ══════════════════════════════════════════════════════════════════════════
     # TEST 7a: Arc-Primordial Thematic Alignment
     # ══════════════════════════════════════════════════════════════════════════
@@ -167,94 +271,57 @@ class MiroStructureTestV2:
            vs mean weight for non-aligned primordials
         4. Test if alignment is significantly higher than chance
         """
-        arc_entity_primordials: Dict[str, Dict[str, List[float]]] = {
-            "D": defaultdict(list),
-            "R": defaultdict(list),
-            "E": defaultdict(list),
-        }
-
-        # Collect primordial weights for entities in each arc's patterns
-        for arc_code, pattern_names in ARC_PATTERN_MAPPING.items():
-            for pname in pattern_names:
-                codes = self.library.get_pattern_motif_codes(pname)
-                entities = self.library.get_entities_for_motif_codes(codes)
-
-                for ent in entities:
-                    mapping = self.mapper.get_mapping(ent)
-                    if not mapping:
-                        continue
-
-                    instantiations = self.acp.get_instantiations(mapping.acp_archetype_id)
-                    for inst in instantiations:
-                        primordial_id = inst.get("primordial", "")
-                        weight = inst.get("weight", 0.5)
-                        arc_entity_primordials[arc_code][primordial_id].append(weight)
-
-        # Compute alignment scores per arc
-        arc_results = {}
-        all_aligned_scores = []
-        all_nonaligned_scores = []
+        if self._arc_entities is None:
+            self._build_arc_index()
 
+        # Size each arc's instance arrays up front, then fill them in place
+        arc_prims: Dict[str, np.ndarray] = {}
+        arc_weights: Dict[str, np.ndarray] = {}
         for arc_code in ["D", "R", "E"]:
-            primordial_weights = arc_entity_primordials[arc_code]
-            aligned_primordials = set(ARC_PRIMORDIAL_ALIGNMENT.get(arc_code, []))
-
-            aligned_weights = []
-            nonaligned_weights = []
-
-            for prim_id, weights in primordial_weights.items():
-                mean_weight = np.mean(weights)
-                if prim_id in aligned_primordials:
-                    aligned_weights.extend(weights)
-                else:
-                    nonaligned_weights.extend(weights)
-
-            aligned_mean = np.mean(aligned_weights) if aligned_weights else 0.0
-            nonaligned_mean = np.mean(nonaligned_weights) if nonaligned_weights else 0.0
-
-            # Mann-Whitney: aligned > nonaligned?
-            if len(aligned_weights) > 1 and len(nonaligned_weights) > 1:
-                stat, p_val = mannwhitneyu(
-                    aligned_weights, nonaligned_weights, alternative="greater"
-                )
-            else:
-                stat, p_val = 0.0, 1.0
-
-            # Top primordials for this arc
-            prim_summary = []
-            for prim_id, weights in sorted(
-                primordial_weights.items(),
-                key=lambda x: -np.mean(x[1]) * len(x[1])
-            )[:5]:
-                prim_summary.append({
-                    "primordial": prim_id,
-                    "mean_weight": round(float(np.mean(weights)), 3),
-                    "count": len(weights),
-                    "aligned": prim_id in aligned_primordials,
-                })
-
-            arc_results[arc_code] = {
-                "n_entities": len(set(
-                    ent for pname in ARC_PATTERN_MAPPING[arc_code]
-                    for ent in self.library.get_entities_for_motif_codes(
-                        self.library.get_pattern_motif_codes(pname)
-                    )
-                )),
-                "n_primordial_instances": sum(len(w) for w in primordial_weights.values()),
-                "aligned_mean": round(float(aligned_mean), 4),
-                "nonaligned_mean": round(float(nonaligned_mean), 4),
-                "alignment_delta": round(float(aligned_mean - nonaligned_mean), 4),
-                "mann_whitney_p": round(float(p_val), 4),
-                "top_primordials": prim_summary,
-            }
+            arc_ents = [
+                ent for pname in ARC_PATTERN_MAPPING.get(arc_code, [])
+                for ent in self._pattern_entities[pname]
+            ]
+            n_insts = sum(len(self._entity_insts.get(ent, ())) for ent in arc_ents)
+            prims = np.empty(n_insts, dtype=object)
+            weights = np.empty(n_insts, dtype=np.float64)
+            k = 0
+            for ent in arc_ents:
+                for inst in self._entity_insts.get(ent, []):
+                    prims[k] = inst.get("primordial", "")
+                    weights[k] = inst.get("weight", 0.5)
+                    k += 1
+            arc_prims[arc_code] = prims
+            arc_weights[arc_code] = weights
+
+        if not any(len(w) for w in arc_weights.values()):
+            # Insight test: nothing to document, but nothing failed either
+            return {"error": "No primordial instances for any arc's entities", "pass": True}
+
+        # Compute alignment scores per arc.  Arcs are independent and only read
+        # the shared weight tables, so they are scored side by side
+        arc_codes = ["D", "R", "E"]
+        with ThreadPoolExecutor(max_workers=len(arc_codes)) as ex:
+            scored = list(ex.map(
+                lambda arc: self._score_arc_alignment(arc, arc_prims[arc], arc_weights[arc]),
+                arc_codes,
+            ))
 
-            all_aligned_scores.extend(aligned_weights)
-            all_nonaligned_scores.extend(nonaligned_weights)
+        arc_results = {}
+        aligned_by_arc: List[np.ndarray] = []
+        nonaligned_by_arc: List[np.ndarray] = []
+        for arc_code, (arc_entry, aligned_weights, nonaligned_weights) in zip(arc_codes, scored):
+            arc_results[arc_code] = arc_entry
+            aligned_by_arc.append(aligned_weights)
+            nonaligned_by_arc.append(nonaligned_weights)
 
         # Overall alignment test
+        all_aligned_scores = np.concatenate(aligned_by_arc)
+        all_nonaligned_scores = np.concatenate(nonaligned_by_arc)
         if len(all_aligned_scores) > 1 and len(all_nonaligned_scores) > 1:
             overall_stat, overall_p = mannwhitneyu(
-                all_aligned_scores, all_nonaligned_scores, alternative="greater"
+                all_aligned_scores, all_nonaligned_scores, alternative="greater",
+                method="asymptotic",
             )
         else:
             overall_stat, overall_p = 0.0, 1.0
@@ -262,8 +329,8 @@ class MiroStructureTestV2:
         result = {
             "method": "primordial_thematic_alignment",
             "arc_results": arc_results,
-            "overall_aligned_mean": round(float(np.mean(all_aligned_scores)), 4) if all_aligned_scores else 0.0,
-            "overall_nonaligned_mean": round(float(np.mean(all_nonaligned_scores)), 4) if all_nonaligned_scores else 0.0,
+            "overall_aligned_mean": round(float(all_aligned_scores.mean()), 4) if len(all_aligned_scores) else 0.0,
+            "overall_nonaligned_mean": round(float(all_nonaligned_scores.mean()), 4) if len(all_nonaligned_scores) else 0.0,
             "overall_mann_whitney_p": round(float(overall_p), 4),
             "primordial_arc_mapping": {
                 arc: prims for arc, prims in ARC_PRIMORDIAL_ALIGNMENT.items()
@@ -289,6 +356,70 @@ class MiroStructureTestV2:
 
         return result
 
+    def _score_arc_alignment(
+        self, arc_code: str, prims: np.ndarray, weights: np.ndarray,
+    ) -> Tuple[dict, np.ndarray, np.ndarray]:
+        """Alignment summary for one arc, plus its aligned and nonaligned weights."""
+        aligned_primordials = ARC_PRIMORDIAL_SETS.get(arc_code, frozenset())
+
+        is_aligned = np.fromiter(
+            (prim_id in aligned_primordials for prim_id in prims), dtype=bool, count=len(prims)
+        )
+        aligned_weights = weights[is_aligned]
+        nonaligned_weights = weights[~is_aligned]
+
+        aligned_mean = aligned_weights.mean() if len(aligned_weights) else 0.0
+        nonaligned_mean = nonaligned_weights.mean() if len(nonaligned_weights) else 0.0
+
+        # Mann-Whitney: aligned > nonaligned?  Weight samples are large and
+        # tie-heavy, so use the normal approximation outright
+        if len(aligned_weights) > 1 and len(nonaligned_weights) > 1:
+            stat, p_val = mannwhitneyu(
+                aligned_weights, nonaligned_weights, alternative="greater",
+                method="asymptotic",
+            )
+        else:
+            stat, p_val = 0.0, 1.0
+
+        # Top primordials for this arc (by total weight), in first-seen order
+        # so that ties keep their original ranking
+        if len(prims):
+            prim_ids, first_idx, inverse = np.unique(
+                prims.astype(str), return_index=True, return_inverse=True
+            )
+            counts = np.bincount(inverse)
+            # np.mean per group (pairwise summation) keeps the rounded means stable
+            groups = np.split(weights[np.argsort(inverse, kind="stable")], np.cumsum(counts)[:-1])
+            prim_stats = [
+                (str(prim_ids[i]), float(groups[i].mean()), int(counts[i]))
+                for i in np.argsort(first_idx)
+            ]
+        else:
+            prim_stats = []
+        prim_summary = [
+            {
+                "primordial": prim_id,
+                "mean_weight": round(mean_weight, 3),
+                "count": count,
+                "aligned": prim_id in aligned_primordials,
+            }
+            for prim_id, mean_weight, count in sorted(
+                prim_stats, key=lambda x: -x[1] * x[2]
+            )[:5]
+        ]
+
+        arc_entry = {
+            "n_entities": len(self._arc_entities[arc_code]),
+            "n_primordial_instances": len(weights),
+            "aligned_mean": round(float(aligned_mean), 4),
+            "nonaligned_mean": round(float(nonaligned_mean), 4),
+            "alignment_delta": round(float(aligned_mean - nonaligned_mean), 4),
+            "mann_whitney_p": round(float(p_val), 4),
+            "top_primordials": prim_summary,
+        }
+
+        return arc_entry, aligned_weights, nonaligned_weights
+
     # ══════════════════════════════════════════════════════════════════════════
     # TEST 7b: Arc-Axis Semantic Alignment
     # ══════════════════════════════════════════════════════════════════════════
@@ -302,35 +433,34 @@ class MiroStructureTestV2:
         2. For each expected axis-direction, test if mean is in expected direction
         3. Compare arc means on discriminating axes
         """
-        arc_coords: Dict[str, List[np.ndarray]] = {"D": [], "R": [], "E": []}
-
-        # Collect coordinates for entities in each arc's patterns
-        for arc_code, pattern_names in ARC_PATTERN_MAPPING.items():
-            seen_entities = set()
-            for pname in pattern_names:
-                codes = self.library.get_pattern_motif_codes(pname)
-                entities = self.library.get_entities_for_motif_codes(codes)
-
-                for ent in entities:
-                    if ent in seen_entities:
-                        continue
-                    seen_entities.add(ent)
+        if self._arc_entities is None:
+            self._build_arc_index()
 
-                    mapping = self.mapper.get_mapping(ent)
-                    if not mapping:
-                        continue
+        # Stack coordinates for the unique entities in each arc's patterns
+        arc_coords: Dict[str, np.ndarray] = {}
+        for arc_code in ["D", "R", "E"]:
+            rows = [
+                self._entity_coords[ent] for ent in self._arc_entities.get(arc_code, [])
+                if ent in self._entity_coords
+            ]
+            arc_coords[arc_code] = (
+                np.array(rows, dtype=np.float64) if rows else np.empty((0, len(AXES)))
+            )
 
-                    coords = self.acp.get_coordinates(mapping.acp_archetype_id)
-                    if coords is not None:
-                        arc_coords[arc_code].append(coords)
+        if not any(len(coords) for coords in arc_coords.values()):
+            # Insight test: nothing to document, but nothing failed either
+            return {"error": "No coordinates for any arc's entities", "pass": True}
 
         # Compute per-arc means
-        arc_means = {}
-        for arc_code, coords_list in arc_coords.items():
-            if coords_list:
-                arc_means[arc_code] = np.mean(coords_list, axis=0)
-            else:
-                arc_means[arc_code] = np.array([0.5] * len(AXES))
+        arc_means = {
+            arc_code: coords.mean(axis=0) if len(coords) else np.full(len(AXES), 0.5)
+            for arc_code, coords in arc_coords.items()
+        }
+        # Reported means, rounded once per arc (builtin round: np.round is not
+        # correctly rounded on near-half values)
+        rounded_means = {
+            arc: [round(v, 4) for v in means.tolist()] for arc, means in arc_means.items()
+        }
 
         # Test axis alignment expectations
         arc_axis_results = {}
@@ -355,7 +485,7 @@ class MiroStructureTestV2:
                     "axis": axis_name,
                     "expected": expected_dir,
                     "expected_range": expected_range,
-                    "actual_mean": round(float(arc_mean), 4),
+                    "actual_mean": rounded_means[arc_code][ax_idx],
                     "met": met,
                 })
 
@@ -372,53 +502,39 @@ class MiroStructureTestV2:
         # Test: D higher on destruction than E, E higher on creation than D
         discriminating_tests = []
 
-        # D vs E on creation-destruction (D should be higher = more destruction)
-        d_cd = arc_means["D"][AXIS_INDEX["creation-destruction"]]
-        e_cd = arc_means["E"][AXIS_INDEX["creation-destruction"]]
-        discriminating_tests.append({
-            "comparison": "D > E on creation-destruction",
-            "D_mean": round(float(d_cd), 4),
-            "E_mean": round(float(e_cd), 4),
-            "delta": round(float(d_cd - e_cd), 4),
-            "met": d_cd > e_cd,
-        })
-
-        # D vs E on light-shadow (D should be higher = more shadow)
-        d_ls = arc_means["D"][AXIS_INDEX["light-shadow"]]
-        e_ls = arc_means["E"][AXIS_INDEX["light-shadow"]]
-        discriminating_tests.append({
-            "comparison": "D > E on light-shadow",
-            "D_mean": round(float(d_ls), 4),
-            "E_mean": round(float(e_ls), 4),
-            "delta": round(float(d_ls - e_ls), 4),
-            "met": d_ls > e_ls,
-        })
-
-        # D vs E on ascent-descent (D should be higher = more descent)
-        d_ad = arc_means["D"][AXIS_INDEX["ascent-descent"]]
-        e_ad = arc_means["E"][AXIS_INDEX["ascent-descent"]]
-        discriminating_tests.append({
-            "comparison": "D > E on ascent-descent",
-            "D_mean": round(float(d_ad), 4),
-            "E_mean": round(float(e_ad), 4),
-            "delta": round(float(d_ad - e_ad), 4),
-            "met": d_ad > e_ad,
-        })
-
-        # Kruskal-Wallis across arcs for each axis
+        # D should be higher than E on each: more destruction, shadow, descent
+        discriminating_axes = ["creation-destruction", "light-shadow", "ascent-descent"]
+        discriminating_idx = [AXIS_INDEX[ax] for ax in discriminating_axes]
+        for ax_name, ax_idx, d_val, e_val in zip(
+            discriminating_axes,
+            discriminating_idx,
+            arc_means["D"][discriminating_idx],
+            arc_means["E"][discriminating_idx],
+        ):
+            discriminating_tests.append({
+                "comparison": f"D > E on {ax_name}",
+                "D_mean": rounded_means["D"][ax_idx],
+                "E_mean": rounded_means["E"][ax_idx],
+                "delta": round(float(d_val - e_val), 4),
+                "met": d_val > e_val,
+            })
+
+        # Kruskal-Wallis across arcs for each axis; every axis shares the arc
+        # grouping, so all eight are ranked and tested in one pass
+        group_arrays = [arc_coords[arc] for arc in ["D", "R", "E"] if len(arc_coords[arc])]
+        testable = len(group_arrays) >= 2 and all(len(g) > 1 for g in group_arrays)
+        if testable:
+            kw_h, kw_p = _kruskal_columns(
+                np.concatenate(group_arrays),
+                np.repeat(np.arange(len(group_arrays)), [len(g) for g in group_arrays]),
+            )
         axis_kw_results = {}
         for ax_idx, ax_name in enumerate(AXES):
-            groups = [
-                [c[ax_idx] for c in arc_coords[arc]]
-                for arc in ["D", "R", "E"]
-                if arc_coords[arc]
-            ]
-            if len(groups) >= 2 and all(len(g) > 1 for g in groups):
-                stat, p_val = kruskal(*groups)
+            if testable:
                 axis_kw_results[ax_name] = {
-                    "H": round(float(stat), 4),
-                    "p": round(float(p_val), 4),
-                    "significant": p_val < 0.05,
+                    "H": round(float(kw_h[ax_idx]), 4),
+                    "p": round(float(kw_p[ax_idx]), 4),
+                    "significant": bool(kw_p[ax_idx] < 0.05),
                 }
             else:
                 axis_kw_results[ax_name] = {"H": 0.0, "p": 1.0, "significant": False}
@@ -427,10 +543,7 @@ class MiroStructureTestV2:
 
         result = {
             "method": "arc_axis_semantic_alignment",
-            "arc_means": {
-                arc: {AXES[i]: round(float(v), 4) for i, v in enumerate(means)}
-                for arc, means in arc_means.items()
-            },
+            "arc_means": {arc: dict(zip(AXES, means)) for arc, means in rounded_means.items()},
             "arc_axis_results": arc_axis_results,
             "discriminating_tests": discriminating_tests,
             "axis_kruskal_wallis": axis_kw_results,
@@ -442,7 +555,8 @@ class MiroStructureTestV2:
         }
 
         # INSIGHT TEST: No pass/fail - document coordinate patterns
-        avg_alignment = np.mean([r["alignment_rate"] for r in arc_axis_results.values()])
+        alignment_rates = [r["alignment_rate"] for r in arc_axis_results.values()]
+        avg_alignment = sum(alignment_rates) / len(alignment_rates)
         discrim_passed = sum(1 for t in discriminating_tests if t["met"])
 
         result["insight_type"] = "arc_axis_semantic_analysis"
@@ -473,48 +587,56 @@ class MiroStructureTestV2:
             tid for tid, cnt in seg_counts.items() if cnt >= MIN_SEGMENTS_PER_TEXT
         ]
 
+        # Walk the segments once, recording each entity mention's position
+        ordinals: List[int] = []
+        totals: List[int] = []
+        mention_coords: List[np.ndarray] = []
+        for text_id in eligible_texts:
+            segments = self.library.get_text_segments_ordered(text_id)
+            if not segments:
+                continue
+            total = len(segments)
+            for seg in segments:
+                for ent_name in seg["entity_names"]:
+                    self._resolve_entity(ent_name)
+                    c = self._entity_coords.get(ent_name)
+                    if c is not None:
+                        ordinals.append(seg["ordinal"])
+                        totals.append(total)
+                        mention_coords.append(c)
+
+        ordinals_arr = np.array(ordinals, dtype=float)
+        totals_arr = np.array(totals, dtype=float)
+        coords_arr = np.array(mention_coords, dtype=float).reshape(-1, len(AXES))
+        # Kept float64: a float32 ratio can shift mentions across bin edges
+        ratio = (ordinals_arr - 1) / np.maximum(totals_arr - 1, 1)
+
+        # Only the bin assignment changes between bin counts
         results_by_bins = {}
-
         for n_bins in [4, 5, 6, 7, 8]:
-            bin_coords: Dict[int, List[np.ndarray]] = defaultdict(list)
-
-            for text_id in eligible_texts:
-                segments = self.library.get_text_segments_ordered(text_id)
-                if not segments:
-                    continue
-                total = len(segments)
-                for seg in segments:
-                    ordinal = seg["ordinal"]
-                    ratio = (ordinal - 1) / max(total - 1, 1)
-                    bin_idx = min(n_bins, int(ratio * n_bins) + 1)
-                    for ent_name in seg["entity_names"]:
-                        mapping = self.mapper.get_mapping(ent_name)
-                        if mapping:
-                            c = self.acp.get_coordinates(mapping.acp_archetype_id)
-                            if c is not None:
-                                bin_coords[bin_idx].append(c)
+            bin_idx = np.minimum(n_bins, (ratio * n_bins).astype(int) + 1)
+
+            # Bins below 1 (ordinal 0 in short texts) are not part of any condition
+            in_range = bin_idx >= 1
+            all_bins, all_coords = bin_idx[in_range], coords_arr[in_range]
+
+            bin_counts = np.bincount(all_bins, minlength=n_bins + 1)[1:]
+            occupied = bin_counts[bin_counts > 0]
+            testable = len(occupied) >= 2 and bool((occupied > 1).all())
+            if testable:
+                # ANOVA for all 8 axes at once; bins are shared across axes
+                f_stats, p_anovas = _anova_columns(all_coords, all_bins)
+                bin_ranks = rankdata(all_bins) if len(all_bins) > 10 else None
 
             # Test per-axis ANOVA across bins
             axis_results = {}
             significant_count = 0
             for ax_idx, ax_name in enumerate(AXES):
-                groups = []
-                for b in range(1, n_bins + 1):
-                    vals = [c[ax_idx] for c in bin_coords.get(b, [])]
-                    if vals:
-                        groups.append(vals)
-
-                if len(groups) >= 2 and all(len(g) > 1 for g in groups):
-                    stat_f, p_f = f_oneway(*groups)
+                if testable:
+                    stat_f, p_f = f_stats[ax_idx], p_anovas[ax_idx]
                     # Test monotonic trend
-                    all_bins_for_axis = []
-                    all_vals_for_axis = []
-                    for b in range(1, n_bins + 1):
-                        for c in bin_coords.get(b, []):
-                            all_bins_for_axis.append(b)
-                            all_vals_for_axis.append(c[ax_idx])
-                    if len(all_bins_for_axis) > 10:
-                        r_s, p_s = spearmanr(all_bins_for_axis, all_vals_for_axis)
+                    if bin_ranks is not None:
+                        r_s, p_s = spearman_from_ranks(bin_ranks, all_coords[:, ax_idx])
                     else:
                         r_s, p_s = 0.0, 1.0
 
@@ -532,7 +654,7 @@ class MiroStructureTestV2:
                         "significant": False,
                     }
 
-            bin_sizes = {b: len(bin_coords.get(b, [])) for b in range(1, n_bins + 1)}
+            bin_sizes = {b: int(bin_counts[b - 1]) for b in range(1, n_bins + 1)}
             results_by_bins[n_bins] = {
                 "n_bins": n_bins,
                 "bin_sizes": bin_sizes,
@@ -567,40 +689,35 @@ class MiroStructureTestV2:
 
     def _test_polarity_pairs(self) -> dict:
         """Test whether polarity pairs show more opposition than non-polarity pairs."""
-        condition_profiles = self.profiler.compute_condition_profiles()
+        if self._condition_profiles is None:
+            self._condition_profiles = self.profiler.compute_condition_profiles()
+        condition_profiles = self._condition_profiles
+
+        # Condition centroids as one (6, 8) matrix, conditions 1-6 in row order
+        cond_matrix = np.array([
+            condition_profiles.get(cond_code, {}).get("mean_coordinates", [0.5] * 8)
+            for cond_code in range(1, 7)
+        ], dtype=np.float64)
 
-        cond_centroids = {}
-        for cond_code in range(1, 7):
-            profile = condition_profiles.get(cond_code, {})
-            coords = profile.get("mean_coordinates", [0.5] * 8)
-            cond_centroids[cond_code] = np.array(coords)
+        # All 15 centroid distances at once; condensed order is combinations order
+        cond_dists = pdist(cond_matrix)
+        cond_pairs = list(combinations(range(1, 7), 2))
 
         # Polarity pairs: 1-4, 2-6, 3-5 (corrected from miroglyph spec)
         polarity_pairs = [(1, 4), (2, 6), (3, 5)]
-        polarity_dists = []
-        polarity_details = []
-        for c1, c2 in polarity_pairs:
-            d = float(np.linalg.norm(cond_centroids[c1] - cond_centroids[c2]))
-            polarity_dists.append(d)
-            polarity_details.append({"pair": f"{c1}-{c2}", "distance": d})
-
-        # Non-polarity pairs
-        non_polarity_dists = []
-        non_polarity_details = []
-        polarity_set = set()
-        for c1, c2 in polarity_pairs:
-            polarity_set.add((c1, c2))
-            polarity_set.add((c2, c1))
-
-        for c1 in range(1, 7):
-            for c2 in range(c1 + 1, 7):
-                if (c1, c2) not in polarity_set:
-                    d = float(np.linalg.norm(cond_centroids[c1] - cond_centroids[c2]))
-                    non_polarity_dists.append(d)
-                    non_polarity_details.append({"pair": f"{c1}-{c2}", "distance": d})
-
-        polarity_arr = np.array(polarity_dists)
-        non_polarity_arr = np.array(non_polarity_dists)
+        is_polarity = np.zeros(len(cond_dists), dtype=bool)
+        is_polarity[[condensed_index(6, c1 - 1, c2 - 1) for c1, c2 in polarity_pairs]] = True
+
+        polarity_arr = cond_dists[is_polarity]
+        non_polarity_arr = cond_dists[~is_polarity]
+        polarity_details = [
+            {"pair": f"{c1}-{c2}", "distance": float(d)}
+            for (c1, c2), d, pol in zip(cond_pairs, cond_dists, is_polarity) if pol
+        ]
+        non_polarity_details = [
+            {"pair": f"{c1}-{c2}", "distance": float(d)}
+            for (c1, c2), d, pol in zip(cond_pairs, cond_dists, is_polarity) if not pol
+        ]
 
         if len(polarity_arr) > 0 and len(non_polarity_arr) > 0:
             stat, p_val = mannwhitneyu(polarity_arr, non_polarity_arr, alternative="greater")
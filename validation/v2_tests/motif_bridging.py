@@ -4,26 +4,56 @@ Tests whether entities from DIFFERENT traditions that share Thompson
 motifs sit closer in ACP space — the properly reframed v1 test that
 eliminates the tradition confound.
 """
+import heapq
 import numpy as np
-from scipy.stats import spearmanr, mannwhitneyu
+from scipy.stats import mannwhitneyu, rankdata
+from pathlib import Path
 from typing import Dict, List, Optional
 from collections import defaultdict
 
-from integration.acp_loader import ACPLoader, AXES
+from integration.acp_loader import ACPLoader, AXIS_TO_IDX
 from integration.library_loader import LibraryLoader
 from integration.entity_mapper import EntityMapper
-from validation.v2_tests import weighted_distance
+from validation.v2_tests import (
+    CACHE_DIR, WEIGHT_SQ_NORMALIZED, load_motif_index, pair_sq_diffs, spearman_from_ranks,
+)
+
+
+def _top_rounded(values: np.ndarray, k: int, largest: bool) -> List[int]:
+    """Indices of the k entries ranked first by round(value, 4), ties in index order.
+
+    Matches a stable sort over the rounded values, but only rounds the
+    entries that can reach the top k: anything whose rounded value ties or
+    beats the k-th raw value lies within 1e-4 of it.
+    """
+    if len(values) > k:
+        if largest:
+            kth = np.partition(values, len(values) - k)[len(values) - k]
+            candidates = np.flatnonzero(values >= kth - 2e-4)
+        else:
+            kth = np.partition(values, k - 1)[k - 1]
+            candidates = np.flatnonzero(values <= kth + 2e-4)
+    else:
+        candidates = np.arange(len(values))
+    select = heapq.nlargest if largest else heapq.nsmallest
+    return select(k, candidates.tolist(), key=lambda idx: round(float(values[idx]), 4))
 
 
 class MotifBridgingTest:
-    def __init__(self, acp: ACPLoader, library: LibraryLoader, mapper: EntityMapper):
+    def __init__(self, acp: ACPLoader, library: LibraryLoader, mapper: EntityMapper,
+                 cache_dir: Optional[str] = None):
         self.acp = acp
         self.library = library
         self.mapper = mapper
+        self.cache_dir = Path(cache_dir) if cache_dir else CACHE_DIR
 
     def run(self) -> Dict:
-        # Get valid mappings with coordinates and tradition info
-        valid = []
+        # Get valid mappings with coordinates and tradition info, as parallel
+        # per-entity columns
+        entity_names: List[str] = []
+        entity_traditions: List[str] = []
+        coord_rows: List[np.ndarray] = []
+        fallback_traditions: Optional[Dict[str, str]] = None
         for m in self.mapper.mappings:
             c = self.acp.get_coordinates(m.acp_archetype_id)
             if c is not None:
@@ -32,80 +62,70 @@ class MotifBridgingTest:
                 if entity:
                     tradition = entity.primary_tradition
                 else:
-                    # Fallback: try to get tradition from the entity list
-                    for e in self.library.get_all_entities():
-                        if e.canonical_name == m.library_entity:
-                            tradition = e.primary_tradition
-                            break
-                valid.append({
-                    "entity": m.library_entity,
-                    "archetype_id": m.acp_archetype_id,
-                    "tradition": tradition,
-                    "coords": c,
-                })
-
-        if len(valid) < 10:
-            return {"error": f"Only {len(valid)} mapped entities"}
-
-        # Build entity motif sets
-        all_motif_codes = self.library.get_all_motif_codes()
-        entity_motifs = {}
-        for v in valid:
-            motifs = set()
-            for code in all_motif_codes:
-                if v["entity"] in self.library.get_motif_entities(code):
-                    motifs.add(code)
-            entity_motifs[v["entity"]] = motifs
-
-        # Compute cross-tradition pairs only
-        n = len(valid)
-        cross_trad_distances = []
-        cross_trad_weighted_distances = []
-        cross_trad_jaccards = []
-        cross_trad_pairs = []
-
-        for i in range(n):
-            for j in range(i + 1, n):
-                # Skip same-tradition pairs
-                if valid[i]["tradition"] == valid[j]["tradition"] and valid[i]["tradition"] != "":
-                    continue
-
-                dist = float(np.linalg.norm(valid[i]["coords"] - valid[j]["coords"]))
-                w_dist = weighted_distance(valid[i]["coords"], valid[j]["coords"])
-                s1 = entity_motifs.get(valid[i]["entity"], set())
-                s2 = entity_motifs.get(valid[j]["entity"], set())
-                union = len(s1 | s2)
-                intersection = len(s1 & s2)
-                jaccard = intersection / union if union > 0 else 0
-
-                cross_trad_distances.append(dist)
-                cross_trad_weighted_distances.append(w_dist)
-                cross_trad_jaccards.append(jaccard)
-                cross_trad_pairs.append({
-                    "entity1": valid[i]["entity"],
-                    "entity2": valid[j]["entity"],
-                    "tradition1": valid[i]["tradition"],
-                    "tradition2": valid[j]["tradition"],
-                    "distance": round(dist, 4),
-                    "jaccard": round(jaccard, 4),
-                    "shared_motifs": len(s1 & s2),
-                    "shared_motif_codes": sorted(list(s1 & s2))[:10],
-                })
-
-        if len(cross_trad_distances) < 10:
+                    # Fallback: tradition from the entity list, indexed once
+                    # (first entity wins for a repeated name)
+                    if fallback_traditions is None:
+                        fallback_traditions = {}
+                        for e in self.library.get_all_entities():
+                            fallback_traditions.setdefault(e.canonical_name, e.primary_tradition)
+                    tradition = fallback_traditions.get(m.library_entity, "")
+                entity_names.append(m.library_entity)
+                entity_traditions.append(tradition)
+                coord_rows.append(c)
+
+        if len(entity_names) < 10:
+            return {"error": f"Only {len(entity_names)} mapped entities"}
+
+        # Build entity motif sets by inverting the (disk-cached) motif index
+        # onto the valid entities
+        motif_index = load_motif_index(self.library, self.cache_dir)
+        valid_names = set(entity_names)
+        entity_motifs = defaultdict(set)
+        for code, code_entities in motif_index.items():
+            for ent in code_entities:
+                if ent in valid_names:
+                    entity_motifs[ent].add(code)
+
+        # Compute cross-tradition pairs only: every i < j pair except those
+        # sharing a known tradition, in row-major order
+        n = len(entity_names)
+        coords = np.asarray(coord_rows, dtype=np.float32)
+        traditions = np.array(entity_traditions)
+        i_idx, j_idx = np.triu_indices(n, k=1)
+        cross = (traditions[i_idx] != traditions[j_idx]) | (traditions[i_idx] == "")
+        i_idx, j_idx = i_idx[cross], j_idx[cross]
+        # Plain, weighted and 3-axis subset distances all reduce the same
+        # squared differences
+        sq_diffs = pair_sq_diffs(coords, i_idx, j_idx)
+        dist_arr = np.sqrt(sq_diffs.sum(axis=1))
+        w_dist_arr = np.sqrt(sq_diffs @ WEIGHT_SQ_NORMALIZED)
+
+        # Motif membership as a 0/1 matrix over the codes the valid entities
+        # carry; one product gives every pair's shared-motif count
+        entity_codes = sorted(set().union(*entity_motifs.values()))
+        code_idx = {code: k for k, code in enumerate(entity_codes)}
+        motifs_by_row = [entity_motifs.get(name, frozenset()) for name in entity_names]
+        membership = np.zeros((n, len(entity_codes)))
+        for row, motifs in enumerate(motifs_by_row):
+            membership[row, [code_idx[c] for c in motifs]] = 1.0
+        motif_counts = membership.sum(axis=1)
+        shared_arr = (membership @ membership.T)[i_idx, j_idx]
+        union_arr = motif_counts[i_idx] + motif_counts[j_idx] - shared_arr
+        jac_arr = np.divide(shared_arr, union_arr, out=np.zeros_like(shared_arr), where=union_arr > 0)
+
+        if len(dist_arr) < 10:
             return {"error": "Insufficient cross-tradition pairs"}
 
-        dist_arr = np.array(cross_trad_distances)
-        jac_arr = np.array(cross_trad_jaccards)
-
-        # 1. Spearman correlation: distance vs Jaccard
-        corr_r, corr_p = spearmanr(dist_arr, jac_arr)
+        # 1. Spearman correlation: distance vs Jaccard.  Jaccard is the shared
+        # side of all three correlations below, so it is ranked once
+        jac_ranks = rankdata(jac_arr)
+        corr_r, corr_p = spearman_from_ranks(jac_ranks, dist_arr)
 
         # 2. Jaccard quartile comparison: top-quartile overlap vs bottom-quartile
         # Binary sharing/non-sharing is meaningless when 97% of pairs share ≥1 motif.
         # Instead, compare pairs with HIGH overlap (Q3+) against LOW overlap (Q1-).
-        q75 = float(np.percentile(jac_arr, 75))
-        q25 = float(np.percentile(jac_arr, 25))
+        # Both quartiles from one partition pass
+        q25, q75 = np.percentile(jac_arr, [25, 75]).tolist()
 
         high_mask = jac_arr >= q75
         low_mask = jac_arr <= q25
@@ -131,35 +151,38 @@ class MotifBridgingTest:
         sharing_pct = round(n_sharing / len(jac_arr) * 100, 1) if len(jac_arr) > 0 else 0
 
         # 3. Test 3-axis subset vs full 8D
-        subset_indices = [AXES.index("order-chaos"), AXES.index("creation-destruction"), AXES.index("individual-collective")]
-        subset_dists = []
-        for i in range(n):
-            for j in range(i + 1, n):
-                if valid[i]["tradition"] == valid[j]["tradition"] and valid[i]["tradition"] != "":
-                    continue
-                diff = valid[i]["coords"][subset_indices] - valid[j]["coords"][subset_indices]
-                subset_dists.append(float(np.linalg.norm(diff)))
-
-        subset_arr = np.array(subset_dists)
-        if len(subset_arr) == len(jac_arr):
-            subset_r, subset_p = spearmanr(subset_arr, jac_arr)
-        else:
-            subset_r, subset_p = 0.0, 1.0
+        subset_indices = [AXIS_TO_IDX["order-chaos"], AXIS_TO_IDX["creation-destruction"], AXIS_TO_IDX["individual-collective"]]
+        subset_arr = np.sqrt(sq_diffs[:, subset_indices].sum(axis=1))
+        subset_r, subset_p = spearman_from_ranks(jac_ranks, subset_arr)
 
         # 4. Weighted distance correlation
-        w_dist_arr = np.array(cross_trad_weighted_distances)
-        w_corr_r, w_corr_p = spearmanr(w_dist_arr, jac_arr)
+        w_corr_r, w_corr_p = spearman_from_ranks(jac_ranks, w_dist_arr)
 
         # 5. Verdicts
         corr_pass = float(corr_r) < -0.05 and corr_p < 0.05
         quartile_pass = float(u_p) < 0.05
 
         # 5. Human review: top overlap pairs and closest cross-tradition pairs
-        sorted_by_jaccard = sorted(cross_trad_pairs, key=lambda x: x["jaccard"], reverse=True)
-        sorted_by_distance = sorted(cross_trad_pairs, key=lambda x: x["distance"])
+        # Only these ~20 pairs are materialized as report records
+        def pair_record(k: int) -> Dict:
+            i, j = int(i_idx[k]), int(j_idx[k])
+            shared_codes = motifs_by_row[i] & motifs_by_row[j]
+            return {
+                "entity1": entity_names[i],
+                "entity2": entity_names[j],
+                "tradition1": entity_traditions[i],
+                "tradition2": entity_traditions[j],
+                "distance": round(float(dist_arr[k]), 4),
+                "jaccard": round(float(jac_arr[k]), 4),
+                "shared_motifs": int(shared_arr[k]),
+                "shared_motif_codes": sorted(shared_codes)[:10],
+            }
+
+        top_by_jaccard = [pair_record(k) for k in _top_rounded(jac_arr, 10, largest=True)]
+        top_by_distance = [pair_record(k) for k in _top_rounded(dist_arr, 10, largest=False)]
 
         return {
-            "n_cross_tradition_pairs": len(cross_trad_distances),
+            "n_cross_tradition_pairs": len(dist_arr),
             "jaccard_distribution": {
                 "q25": round(q25, 4),
                 "q75": round(q75, 4),
@@ -207,7 +230,7 @@ class MotifBridgingTest:
                 "overall_pass": corr_pass and quartile_pass,
             },
             "human_review": {
-                "highest_motif_overlap": sorted_by_jaccard[:10],
-                "closest_cross_tradition": sorted_by_distance[:10],
+                "highest_motif_overlap": top_by_jaccard,
+                "closest_cross_tradition": top_by_distance,
             },
         }
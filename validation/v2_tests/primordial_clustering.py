@@ -5,13 +5,35 @@ Tests whether archetypes sharing primordial instantiation profiles
 together in ACP 8D spectral space.
 """
 import numpy as np
-from scipy.stats import spearmanr
-from scipy.spatial.distance import pdist, squareform
-from typing import Dict, List
+from scipy.stats import rankdata
+from scipy.spatial.distance import pdist
+from typing import Dict, List, Tuple
 from collections import defaultdict
 
 from integration.acp_loader import ACPLoader, AXES
-from validation.v2_tests import weighted_pdist
+from validation.v2_tests import condensed_index, spearman_from_ranks, weighted_pdist
+
+# Permuted pair similarities ranked per batch in the permutation test;
+# bounds the (batch, n_pairs) working arrays to a few tens of MB
+PERM_BATCH_PAIRS = 2_000_000
+
+# Optional early stop of the permutation test: after each batch of at most
+# EARLY_STOP_BATCH permutations, stop once the Wilson interval (z-score
+# EARLY_STOP_Z) of the running empirical p lies wholly on one side of
+# PERM_ALPHA, the significance level the correlation verdict uses
+PERM_ALPHA = 0.01
+EARLY_STOP_BATCH = 100
+EARLY_STOP_Z = 3.0
+
+
+def _wilson_bounds(hits: int, n: int, z: float) -> Tuple[float, float]:
+    """Wilson score interval for the binomial proportion hits / n."""
+    p_hat = hits / n
+    z2 = z * z
+    denom = 1.0 + z2 / n
+    centre = (p_hat + z2 / (2 * n)) / denom
+    half = z * np.sqrt(p_hat * (1.0 - p_hat) / n + z2 / (4 * n * n)) / denom
+    return centre - half, centre + half
 
 
 class PrimordialClusteringTest:
@@ -28,33 +50,50 @@ class PrimordialClusteringTest:
         prim_index = {pid: i for i, pid in enumerate(primordial_ids)}
         n_prims = len(primordial_ids)
 
-        vectors = {}
-        for arch_id in self.acp.archetypes:
-            vec = np.zeros(n_prims)
+        # Collect weights keyed by (row, col), so a repeated primordial keeps
+        # its last weight, then fill the matrix in one assignment (NumPy does
+        # not define which value wins for repeated fancy indices)
+        arch_ids = list(self.acp.archetypes)
+        cells = {}
+        for row, arch_id in enumerate(arch_ids):
             for inst in self.acp.get_instantiations(arch_id):
-                pid = inst.get("primordial", "")
-                weight = inst.get("weight", 0.0)
-                if pid in prim_index:
-                    vec[prim_index[pid]] = weight
-            if vec.sum() > 0:
-                vectors[arch_id] = vec
+                col = prim_index.get(inst.get("primordial", ""))
+                if col is not None:
+                    cells[row, col] = inst.get("weight", 0.0)
+
+        mat = np.zeros((len(arch_ids), n_prims))
+        if cells:
+            rows, cols = zip(*cells)
+            mat[rows, cols] = list(cells.values())
+        keep = np.flatnonzero(mat.sum(axis=1) > 0)
+        vectors = {arch_ids[k]: mat[k] for k in keep.tolist()}
 
         return vectors, primordial_ids
 
-    def run(self, n_permutations: int = 1000, seed: int = 42) -> Dict:
+    def run(self, n_permutations: int = 1000, seed: int = 42,
+            early_stop: bool = False) -> Dict:
+        """Run the test.
+
+        With early_stop, the permutation test ends as soon as its empirical
+        p is clearly above or below PERM_ALPHA; the reported null statistics
+        and n_permutations then cover only the permutations actually run.
+        """
         rng = np.random.default_rng(seed)
 
         prim_vectors, primordial_ids = self._build_primordial_vectors()
 
-        valid_ids = [
-            aid for aid in prim_vectors
-            if self.acp.get_coordinates(aid) is not None
-        ]
+        # Coordinates are looked up once per archetype and reused below
+        coords_map = {}
+        for aid in prim_vectors:
+            c = self.acp.get_coordinates(aid)
+            if c is not None:
+                coords_map[aid] = c
+        valid_ids = list(coords_map)
 
         if len(valid_ids) < 10:
             return {"error": f"Only {len(valid_ids)} archetypes with both coordinates and primordial data"}
 
-        coords = np.array([self.acp.get_coordinates(aid) for aid in valid_ids])
+        coords = np.array([coords_map[aid] for aid in valid_ids])
         prim_vecs = np.array([prim_vectors[aid] for aid in valid_ids])
         n = len(valid_ids)
 
@@ -65,30 +104,60 @@ class PrimordialClusteringTest:
         # Weighted spectral distances
         w_sd_arr = weighted_pdist(coords)
 
-        # Primordial cosine similarity (1 - cosine_distance)
-        # pdist returns distances; we want similarity = 1 - distance
-        prim_cos_dists = pdist(prim_vecs, metric="cosine")
-        # Replace NaN (from zero vectors) with 1.0 (max distance = 0 similarity)
-        prim_cos_dists = np.nan_to_num(prim_cos_dists, nan=1.0)
-        ps_arr = 1.0 - prim_cos_dists
+        # Primordial cosine similarity from one product of unit rows.  A zero
+        # vector keeps a zero row and so has similarity 0 with everything
+        idx_i, idx_j = np.triu_indices(n, k=1)
+        prim_norms = np.linalg.norm(prim_vecs, axis=1, keepdims=True)
+        prim_unit = prim_vecs / np.where(prim_norms == 0, 1.0, prim_norms)
+        ps_arr = np.clip((prim_unit @ prim_unit.T)[idx_i, idx_j], -1.0, 1.0)
 
-        obs_r, obs_p = spearmanr(ps_arr, sd_arr)
-        w_obs_r, w_obs_p = spearmanr(ps_arr, w_sd_arr)
+        # Similarities are ranked once and shared by both observed statistics
+        ps_rank = rankdata(ps_arr)
+        obs_r, obs_p = spearman_from_ranks(ps_rank, sd_arr)
+        w_obs_r, w_obs_p = spearman_from_ranks(ps_rank, w_sd_arr)
 
-        # 2. Vectorized permutation test: shuffle rows of primordial matrix
-        # Pre-compute the full cosine similarity matrix for permutation reindexing
-        prim_sim_matrix = 1.0 - squareform(prim_cos_dists)
-        np.fill_diagonal(prim_sim_matrix, 1.0)
-        idx_i, idx_j = np.triu_indices(n, k=1)
+        # 2. Vectorized permutation test: shuffle rows of primordial matrix.
+        # Permuted pair (perm[i], perm[j]) is read straight from the condensed
+        # similarities; a permutation never maps i != j onto the diagonal
 
-        null_rs = []
-        for _ in range(n_permutations):
-            perm = rng.permutation(n)
-            shuffled_sims = prim_sim_matrix[np.ix_(perm, perm)][idx_i, idx_j]
-            r, _ = spearmanr(shuffled_sims, sd_arr)
-            null_rs.append(float(r))
+        # Spearman is Pearson on ranks and the distance side never changes,
+        # so its ranks are centered and normalized once; each batch of
+        # permutations is ranked row-wise and correlated in one product.
+        # Permutations are drawn one at a time to keep the seeded stream.
+        # Average ranks are half-integers whose row mean is always
+        # (n_pairs + 1) / 2, so the batch ranks are held and centered
+        # exactly in float32, halving the largest working array
+        perms = np.array([rng.permutation(n) for _ in range(n_permutations)]).reshape(-1, n)
+        sd_rank = rankdata(sd_arr)
+        sd_rank -= sd_rank.mean()
+        sd_rank /= np.linalg.norm(sd_rank)
+        sd_rank = sd_rank.astype(np.float32)
+        rank_mean = np.float32((len(sd_arr) + 1) / 2)
+        batch_size = max(1, PERM_BATCH_PAIRS // max(len(sd_arr), 1))
+        if early_stop:
+            batch_size = min(batch_size, EARLY_STOP_BATCH)
+        null_arr = np.empty(n_permutations)
+        n_done = n_permutations
+        for start in range(0, n_permutations, batch_size):
+            batch = perms[start:start + batch_size]
+            pi, pj = batch[:, idx_i], batch[:, idx_j]
+            shuffled_sims = ps_arr[condensed_index(n, np.minimum(pi, pj), np.maximum(pi, pj))]
+            shuffled_ranks = rankdata(shuffled_sims, axis=1).astype(np.float32)
+            shuffled_ranks -= rank_mean
+            with np.errstate(divide="ignore", invalid="ignore"):
+                null_arr[start:start + batch_size] = (
+                    (shuffled_ranks @ sd_rank)
+                    / np.sqrt(np.einsum("ij,ij->i", shuffled_ranks, shuffled_ranks))
+                )
+            done = start + len(batch)
+            if early_stop and done < n_permutations:
+                hits = int((null_arr[:done] <= float(obs_r)).sum())
+                low, high = _wilson_bounds(hits, done, EARLY_STOP_Z)
+                if low > PERM_ALPHA or high < PERM_ALPHA:
+                    n_done = done
+                    break
+        null_arr = null_arr[:n_done]
 
-        null_arr = np.array(null_rs)
         perm_p = float(np.mean(null_arr <= float(obs_r)))
 
         # 3. Cluster by dominant primordial
@@ -99,41 +168,45 @@ class PrimordialClusteringTest:
             dom_prim = primordial_ids[dom_idx]
             dominant.setdefault(dom_prim, []).append(aid)
 
-        within_dists = []
-        between_dists = []
-        for prim, members in dominant.items():
-            if len(members) < 2:
-                continue
-            member_coords = [self.acp.get_coordinates(m) for m in members]
-            for i in range(len(members)):
-                for j in range(i + 1, len(members)):
-                    within_dists.append(float(np.linalg.norm(member_coords[i] - member_coords[j])))
-
-        # Between-cluster: sample pairs from different clusters
+        # Stack each cluster's member coordinates once; within-cluster pair
+        # distances are one pdist per cluster, reused by the centroids below
         cluster_keys = [k for k in dominant if len(dominant[k]) >= 2]
+        cluster_coords = {k: np.array([coords_map[m] for m in dominant[k]]) for k in cluster_keys}
+        cluster_pdists = {k: pdist(cluster_coords[k]) for k in cluster_keys}
+        within_dists = (
+            np.concatenate([cluster_pdists[k] for k in cluster_keys]) if cluster_keys else np.empty(0)
+        )
+
+        # Between-cluster: sample up to 5 pairs per cluster pair.  A single
+        # draw with per-sample bounds yields the same stream as drawing the
+        # two members of each sample in turn
+        member_offsets = np.cumsum([0] + [len(dominant[k]) for k in cluster_keys])
+        sample_clusters = []
+        sample_bounds = []
         for ci in range(len(cluster_keys)):
             for cj in range(ci + 1, len(cluster_keys)):
-                m1 = dominant[cluster_keys[ci]]
-                m2 = dominant[cluster_keys[cj]]
-                # Sample up to 5 pairs per cluster pair
-                for _ in range(min(5, len(m1) * len(m2))):
-                    a1 = m1[rng.integers(len(m1))]
-                    a2 = m2[rng.integers(len(m2))]
-                    c1 = self.acp.get_coordinates(a1)
-                    c2 = self.acp.get_coordinates(a2)
-                    between_dists.append(float(np.linalg.norm(c1 - c2)))
-
-        within_mean = float(np.mean(within_dists)) if within_dists else 0
-        between_mean = float(np.mean(between_dists)) if between_dists else 0
+                n1, n2 = len(dominant[cluster_keys[ci]]), len(dominant[cluster_keys[cj]])
+                n_samples = min(5, n1 * n2)
+                sample_clusters.extend([(ci, cj)] * n_samples)
+                sample_bounds.extend([n1, n2] * n_samples)
+        if sample_clusters:
+            draws = rng.integers(np.array(sample_bounds, dtype=np.int64)).reshape(-1, 2)
+            rows = member_offsets[np.array(sample_clusters)] + draws
+            all_members = np.concatenate([cluster_coords[k] for k in cluster_keys])
+            diff = all_members[rows[:, 0]] - all_members[rows[:, 1]]
+            between_dists = np.sqrt((diff * diff).sum(axis=1))
+        else:
+            between_dists = np.empty(0)
+
+        within_mean = float(within_dists.mean()) if len(within_dists) else 0
+        between_mean = float(between_dists.mean()) if len(between_dists) else 0
         cluster_ratio = (between_mean - within_mean) / between_mean if between_mean > 0 else 0
 
         # 4. Per-primordial centroid analysis (for human review)
         primordial_centroids = {}
-        for prim, members in dominant.items():
-            if len(members) < 2:
-                continue
-            member_coords = np.array([self.acp.get_coordinates(m) for m in members])
-            centroid = member_coords.mean(axis=0)
+        for prim in cluster_keys:
+            members = dominant[prim]
+            centroid = cluster_coords[prim].mean(axis=0)
             member_names = [
                 self.acp.archetypes.get(m, {}).get("name", m) for m in members
             ]
@@ -141,15 +214,11 @@ class PrimordialClusteringTest:
                 "n_members": len(members),
                 "centroid": {AXES[k]: round(float(centroid[k]), 4) for k in range(len(AXES))},
                 "members": member_names[:10],  # Cap at 10 for readability
-                "within_cluster_mean_dist": round(float(np.mean([
-                    np.linalg.norm(member_coords[i] - member_coords[j])
-                    for i in range(len(members))
-                    for j in range(i + 1, len(members))
-                ])), 4) if len(members) >= 2 else 0,
+                "within_cluster_mean_dist": round(float(cluster_pdists[prim].mean()), 4),
             }
 
         # 5. Verdicts
-        correlation_pass = float(obs_r) < -0.15 and perm_p < 0.01
+        correlation_pass = float(obs_r) < -0.15 and perm_p < PERM_ALPHA
         cluster_pass = cluster_ratio >= 0.10
 
         return {
@@ -161,13 +230,13 @@ class PrimordialClusteringTest:
                 "spearman_p": round(float(obs_p), 6),
             },
             "permutation_test": {
-                "n_permutations": n_permutations,
+                "n_permutations": n_done,
                 "empirical_p": round(perm_p, 4),
                 "null_mean": round(float(null_arr.mean()), 4),
                 "null_std": round(float(null_arr.std()), 4),
             },
             "cluster_analysis": {
-                "n_clusters": len([k for k in dominant if len(dominant[k]) >= 2]),
+                "n_clusters": len(cluster_keys),
                 "within_cluster_mean": round(within_mean, 4),
                 "between_cluster_mean": round(between_mean, 4),
                 "separation_ratio": round(cluster_ratio, 4),
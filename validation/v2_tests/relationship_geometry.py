@@ -5,10 +5,29 @@ produce distinct geometric patterns in ACP 8D space.
 """
 import numpy as np
 from scipy.stats import kruskal, mannwhitneyu
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
-from integration.acp_loader import ACPLoader, AXES
-from validation.v2_tests import weighted_distance
+from integration.acp_loader import ACPLoader, AXES, AXIS_TO_IDX
+from validation.v2_tests import pair_distances
+
+
+def _sorted_ends(values: np.ndarray, k: int) -> Tuple[List[int], List[int]]:
+    """First and last k indices of a stable ascending sort of values.
+
+    Only the entries that can reach either end (everything tied with or
+    beyond the k-th value from that end) are sorted, so ties keep the
+    index order sorted() would give.
+    """
+    if len(values) <= k:
+        order = np.argsort(values, kind="stable").tolist()
+        return order, order
+    low_kth = np.partition(values, k - 1)[k - 1]
+    high_kth = np.partition(values, len(values) - k)[len(values) - k]
+    low = np.flatnonzero(values <= low_kth)
+    high = np.flatnonzero(values >= high_kth)
+    low = low[np.argsort(values[low], kind="stable")[:k]]
+    high = high[np.argsort(values[high], kind="stable")[-k:]]
+    return low.tolist(), high.tolist()
 
 
 class RelationshipGeometryTest:
@@ -18,64 +37,91 @@ class RelationshipGeometryTest:
     def _parse_axis_name(self, axis_ref: str) -> Optional[int]:
         """Convert axis reference like 'axis:ascent-descent' to index."""
         name = axis_ref.replace("axis:", "").strip()
-        if name in AXES:
-            return AXES.index(name)
+        if name in AXIS_TO_IDX:
+            return AXIS_TO_IDX[name]
         # Try partial match
         for i, a in enumerate(AXES):
             if name in a or a in name:
                 return i
         return None
 
+    def _pair_record(self, group: Dict, k: int) -> Dict:
+        """Full review record for pair k of a relationship-type group."""
+        rel = group["rels"][k]
+        diff_row = group["abs_diffs"][k].tolist()
+        max_axis_idx = int(group["max_axes"][k])
+        return {
+            "source": rel["source"],
+            "target": rel["target"],
+            "source_name": self.acp.archetypes.get(rel["source"], {}).get("name", ""),
+            "target_name": self.acp.archetypes.get(rel["target"], {}).get("name", ""),
+            "distance": float(group["distances"][k]),
+            "weighted_distance": float(group["weighted_distances"][k]),
+            "per_axis_diff": {a: round(d, 4) for a, d in zip(AXES, diff_row)},
+            "max_diff_axis": AXES[max_axis_idx],
+            "max_diff_value": round(diff_row[max_axis_idx], 4),
+            "declared_axis": rel.get("axis", None),
+            "strength": rel.get("strength", None),
+            "fidelity": rel.get("fidelity", None),
+        }
+
     def run(self, seed: int = 42) -> Dict:
         rng = np.random.default_rng(seed)
 
-        # Collect relationships by type
+        # Coordinates are looked up once per archetype and reused below
+        coords_map = {}
+        for aid in self.acp.archetypes:
+            c = self.acp.get_coordinates(aid)
+            if c is not None:
+                coords_map[aid] = c
+        all_ids = list(coords_map)
+        all_coords = np.array([coords_map[aid] for aid in all_ids])
+        id_to_row = {aid: k for k, aid in enumerate(all_ids)}
+
+        # Collect relationships by type; the geometry of each type is
+        # computed for all of its pairs at once and kept as arrays.  Full
+        # per-pair records are only built for the human review samples
         type_groups = {}
         for rel_type in ["POLAR_OPPOSITE", "COMPLEMENT", "SHADOW", "EVOLUTION", "ANTAGONIST"]:
-            rels = self.acp.get_all_relationships(type_filter=rel_type)
-            valid = []
-            for rel in rels:
-                c1 = self.acp.get_coordinates(rel["source"])
-                c2 = self.acp.get_coordinates(rel.get("target", ""))
-                if c1 is not None and c2 is not None:
-                    dist = float(np.linalg.norm(c1 - c2))
-                    w_dist = weighted_distance(c1, c2)
-                    per_axis = {
-                        AXES[k]: round(abs(float(c1[k] - c2[k])), 4)
-                        for k in range(len(AXES))
-                    }
-                    max_axis_idx = int(np.argmax(np.abs(c1 - c2)))
-                    valid.append({
-                        "source": rel["source"],
-                        "target": rel.get("target", ""),
-                        "source_name": self.acp.archetypes.get(rel["source"], {}).get("name", ""),
-                        "target_name": self.acp.archetypes.get(rel.get("target", ""), {}).get("name", ""),
-                        "distance": dist,
-                        "weighted_distance": w_dist,
-                        "per_axis_diff": per_axis,
-                        "max_diff_axis": AXES[max_axis_idx],
-                        "max_diff_value": round(abs(float(c1[max_axis_idx] - c2[max_axis_idx])), 4),
-                        "declared_axis": rel.get("axis", None),
-                        "strength": rel.get("strength", None),
-                        "fidelity": rel.get("fidelity", None),
-                    })
-            type_groups[rel_type] = valid
+            rels = [
+                rel for rel in self.acp.get_all_relationships(type_filter=rel_type)
+                if rel["source"] in id_to_row and rel.get("target", "") in id_to_row
+            ]
+            src = np.array([id_to_row[rel["source"]] for rel in rels], dtype=int)
+            tgt = np.array([id_to_row[rel["target"]] for rel in rels], dtype=int)
+            dists, w_dists = pair_distances(all_coords, src, tgt)
+            abs_diffs = np.abs(all_coords[src] - all_coords[tgt])
+            type_groups[rel_type] = {
+                "rels": rels,
+                "src": src,
+                "tgt": tgt,
+                "distances": dists,
+                "weighted_distances": w_dists,
+                "abs_diffs": abs_diffs,
+                "max_axes": abs_diffs.argmax(axis=1),
+            }
 
         # --- POLAR_OPPOSITE specific tests ---
-        polar = type_groups.get("POLAR_OPPOSITE", [])
+        polar = type_groups["POLAR_OPPOSITE"]
         polar_axis_pass_count = 0
         polar_axis_max_match = 0
-        polar_with_axis = [p for p in polar if p["declared_axis"]]
-
-        for p in polar_with_axis:
-            axis_idx = self._parse_axis_name(p["declared_axis"])
-            if axis_idx is not None:
-                axis_name = AXES[axis_idx]
-                diff_on_axis = p["per_axis_diff"].get(axis_name, 0)
-                if diff_on_axis > 0.5:
-                    polar_axis_pass_count += 1
-                if p["max_diff_axis"] == axis_name:
-                    polar_axis_max_match += 1
+        polar_with_axis = [k for k, rel in enumerate(polar["rels"]) if rel.get("axis")]
+
+        # Each distinct declared axis is parsed once; pairs whose axis does
+        # not resolve are counted in the denominator only
+        axis_lookup = {
+            ref: self._parse_axis_name(ref)
+            for ref in {polar["rels"][k]["axis"] for k in polar_with_axis}
+        }
+        parsed = [(k, axis_lookup[polar["rels"][k]["axis"]]) for k in polar_with_axis]
+        parsed = [(k, a) for k, a in parsed if a is not None]
+        if parsed:
+            rows, axis_idx = np.array(parsed).T
+            # Compared at the 4-decimal precision reported in per_axis_diff,
+            # rounded with round() exactly as the report is
+            diff_on_axis = [round(d, 4) for d in polar["abs_diffs"][rows, axis_idx].tolist()]
+            polar_axis_pass_count = sum(d > 0.5 for d in diff_on_axis)
+            polar_axis_max_match = int((polar["max_axes"][rows] == axis_idx).sum())
 
         n_polar_with_axis = len(polar_with_axis)
         polar_axis_pct = (polar_axis_pass_count / n_polar_with_axis * 100) if n_polar_with_axis > 0 else 0
@@ -83,27 +129,24 @@ class RelationshipGeometryTest:
 
         # --- Cross-type distance comparison ---
         type_distances = {}
-        for t, pairs in type_groups.items():
-            if pairs:
-                dists = [p["distance"] for p in pairs]
+        for t, group in type_groups.items():
+            dists = group["distances"]
+            if len(dists):
                 type_distances[t] = {
-                    "n_pairs": len(pairs),
+                    "n_pairs": len(dists),
                     "mean": round(float(np.mean(dists)), 4),
                     "median": round(float(np.median(dists)), 4),
                     "std": round(float(np.std(dists)), 4),
                 }
 
-        # Random baseline
-        all_ids = [aid for aid in self.acp.archetypes if self.acp.get_coordinates(aid) is not None]
-        random_dists = []
-        for _ in range(500):
-            i, j = rng.choice(len(all_ids), size=2, replace=False)
-            c1 = self.acp.get_coordinates(all_ids[i])
-            c2 = self.acp.get_coordinates(all_ids[j])
-            random_dists.append(float(np.linalg.norm(c1 - c2)))
-        random_arr = np.array(random_dists)
+        # Random baseline: 500 seeded pairs of distinct archetypes, measured
+        # in one pass; the weighted baseline below uses the same pairs
+        random_pairs = np.array([
+            rng.choice(len(all_ids), size=2, replace=False) for _ in range(500)
+        ])
+        random_arr, w_random_arr = pair_distances(all_coords, random_pairs[:, 0], random_pairs[:, 1])
         type_distances["RANDOM"] = {
-            "n_pairs": len(random_dists),
+            "n_pairs": len(random_arr),
             "mean": round(float(random_arr.mean()), 4),
             "median": round(float(np.median(random_arr)), 4),
             "std": round(float(random_arr.std()), 4),
@@ -112,9 +155,9 @@ class RelationshipGeometryTest:
         # Kruskal-Wallis test across all types
         group_arrays = []
         group_labels = []
-        for t, pairs in type_groups.items():
-            if len(pairs) >= 3:
-                group_arrays.append([p["distance"] for p in pairs])
+        for t, group in type_groups.items():
+            if len(group["rels"]) >= 3:
+                group_arrays.append(group["distances"])
                 group_labels.append(t)
 
         kw_stat, kw_p = (0, 1.0)
@@ -122,41 +165,31 @@ class RelationshipGeometryTest:
             kw_stat, kw_p = kruskal(*group_arrays)
 
         # --- EVOLUTION direction test ---
-        evolution = type_groups.get("EVOLUTION", [])
-        evo_transform_idx = AXES.index("stasis-transformation")
-        evo_correct_direction = 0
-        for e in evolution:
-            c1 = self.acp.get_coordinates(e["source"])
-            c2 = self.acp.get_coordinates(e["target"])
-            if c1 is not None and c2 is not None:
-                # Target should be more toward transformation (higher value)
-                if c2[evo_transform_idx] > c1[evo_transform_idx]:
-                    evo_correct_direction += 1
-        evo_dir_pct = (evo_correct_direction / len(evolution) * 100) if evolution else 0
+        evolution = type_groups["EVOLUTION"]
+        n_evolution = len(evolution["rels"])
+        evo_transform_idx = AXIS_TO_IDX["stasis-transformation"]
+        # Target should be more toward transformation (higher value)
+        evo_transform = all_coords[:, evo_transform_idx]
+        evo_correct_direction = int(
+            (evo_transform[evolution["tgt"]] > evo_transform[evolution["src"]]).sum()
+        )
+        evo_dir_pct = (evo_correct_direction / n_evolution * 100) if n_evolution else 0
 
         # --- Weighted distance comparison ---
         w_type_distances = {}
-        for t, pairs in type_groups.items():
-            if pairs:
-                w_dists = [p["weighted_distance"] for p in pairs]
+        for t, group in type_groups.items():
+            w_dists = group["weighted_distances"]
+            if len(w_dists):
                 w_type_distances[t] = {
-                    "n_pairs": len(pairs),
+                    "n_pairs": len(w_dists),
                     "mean": round(float(np.mean(w_dists)), 4),
                     "median": round(float(np.median(w_dists)), 4),
                     "std": round(float(np.std(w_dists)), 4),
                 }
 
-        # Weighted random baseline
-        w_random_dists = []
-        rng_w = np.random.default_rng(seed)
-        for _ in range(500):
-            i, j = rng_w.choice(len(all_ids), size=2, replace=False)
-            c1 = self.acp.get_coordinates(all_ids[i])
-            c2 = self.acp.get_coordinates(all_ids[j])
-            w_random_dists.append(weighted_distance(c1, c2))
-        w_random_arr = np.array(w_random_dists)
+        # Weighted random baseline (same pairs as the unweighted one)
         w_type_distances["RANDOM"] = {
-            "n_pairs": len(w_random_dists),
+            "n_pairs": len(w_random_arr),
             "mean": round(float(w_random_arr.mean()), 4),
             "median": round(float(np.median(w_random_arr)), 4),
             "std": round(float(w_random_arr.std()), 4),
@@ -165,9 +198,9 @@ class RelationshipGeometryTest:
         # Weighted Kruskal-Wallis
         w_group_arrays = []
         w_group_labels = []
-        for t, pairs in type_groups.items():
-            if len(pairs) >= 3:
-                w_group_arrays.append([p["weighted_distance"] for p in pairs])
+        for t, group in type_groups.items():
+            if len(group["rels"]) >= 3:
+                w_group_arrays.append(group["weighted_distances"])
                 w_group_labels.append(t)
         w_kw_stat, w_kw_p = (0, 1.0)
         if len(w_group_arrays) >= 2:
@@ -178,17 +211,20 @@ class RelationshipGeometryTest:
         polar_max_pass = polar_max_pct >= 50
         kw_pass = float(kw_p) < 0.05
 
-        # Human review samples
+        # Human review samples: the 5 closest and 5 farthest pairs per type
         human_review = {}
-        for t, pairs in type_groups.items():
-            sorted_pairs = sorted(pairs, key=lambda x: x["distance"])
+        for t, group in type_groups.items():
+            closest, farthest = _sorted_ends(group["distances"], 5)
             human_review[t] = {
-                "examples": sorted_pairs[:5],
-                "worst_violators": sorted_pairs[-5:] if len(sorted_pairs) > 5 else [],
+                "examples": [self._pair_record(group, k) for k in closest],
+                "worst_violators": (
+                    [self._pair_record(group, k) for k in farthest]
+                    if len(group["rels"]) > 5 else []
+                ),
             }
 
         return {
-            "relationship_counts": {t: len(p) for t, p in type_groups.items()},
+            "relationship_counts": {t: len(g["rels"]) for t, g in type_groups.items()},
             "polar_opposite_tests": {
                 "n_with_declared_axis": n_polar_with_axis,
                 "axis_diff_gt_05_count": polar_axis_pass_count,
@@ -203,7 +239,7 @@ class RelationshipGeometryTest:
                 "groups_tested": group_labels,
             },
             "evolution_direction": {
-                "n_pairs": len(evolution),
+                "n_pairs": n_evolution,
                 "correct_direction_count": evo_correct_direction,
                 "correct_direction_pct": round(evo_dir_pct, 1),
             },